@@ -1,7 +1,7 @@
 """JWT token generation, validation, and auth dependencies."""
 
+import time
 import uuid
-from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
 import jwt
@@ -23,12 +23,13 @@ _bearer_scheme = HTTPBearer(auto_error=False)
 
 def create_access_token(user_id: uuid.UUID, email: str) -> str:
     """Create a signed JWT for the given user."""
-    now = datetime.now(UTC)
+    # Integer POSIX seconds are what PyJWT would serialise datetimes to anyway.
+    now = int(time.time())
     payload = {
         "sub": str(user_id),
         "email": email,
         "iat": now,
-        "exp": now + timedelta(hours=settings.jwt_expiry_hours),
+        "exp": now + settings.jwt_expiry_hours * 3600,
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
@@ -1,13 +1,17 @@
 """FastAPI application factory."""
 
+import asyncio
+from collections.abc import Coroutine
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 import structlog
 from elasticsearch import AsyncElasticsearch
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from sqlalchemy import func, text
@@ -279,12 +283,98 @@ async def lifespan(app: FastAPI):
     await engine.dispose()
 
 
+HEALTH_PROBE_TIMEOUT_S = 2.0
+_HEALTH_SERVICES = ("elasticsearch", "postgres", "redis", "neo4j")
+# Proxies must never serve a stale "healthy" answer for a backend that has since gone down.
+_HEALTH_HEADERS = {"Cache-Control": "no-store, no-cache, must-revalidate", "Pragma": "no-cache"}
+
+
+async def _check_es(es_client: AsyncElasticsearch) -> bool:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    ok = await es_client.ping()
+    latency_ms = (loop.time() - start) * 1000
+    # A cluster that answers but slowly is treated as down so monitors alert before it stops answering.
+    if ok and latency_ms >= settings.health_es_slow_ms:
+        logger.warning("health_check_es_slow", latency_ms=round(latency_ms, 1))
+        return False
+    return bool(ok)
+
+
+async def _check_pg(db: AsyncSession) -> bool:
+    await db.execute(text("SELECT 1"))
+    return True
+
+
+async def _check_redis(redis_client) -> bool:
+    if not redis_client:
+        return False
+    return bool(await redis_client.ping())
+
+
+async def _check_neo4j(graph_service) -> bool:
+    if not graph_service:
+        return False
+    async with graph_service.client.driver.session() as session:
+        await session.run("RETURN 1")
+    return True
+
+
+async def _probe(name: str, check: Coroutine[Any, Any, bool]) -> tuple[str, float]:
+    """Await one health check under ``HEALTH_PROBE_TIMEOUT_S``; return its status and latency in ms.
+
+    Errors and timeouts report "down".
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    try:
+        status = "up" if await asyncio.wait_for(check, timeout=HEALTH_PROBE_TIMEOUT_S) else "down"
+    except Exception:
+        logger.warning(f"health_check_{name}_failed", exc_info=True)
+        status = "down"
+    latency_ms = round((loop.time() - start) * 1000, 1)
+    logger.debug("health_check", service=name, status=status, latency_ms=latency_ms)
+    return status, latency_ms
+
+
+async def _health_report(
+    es_client: AsyncElasticsearch, db: AsyncSession, state
+) -> tuple[dict[str, Any], int, dict[str, float]]:
+    """Probe every backend; return the health body, its status code and per-service latencies."""
+    # Probes are independent, so total latency is the slowest check rather than the sum.
+    results = await asyncio.gather(
+        _probe("es", _check_es(es_client)),
+        _probe("pg", _check_pg(db)),
+        _probe("redis", _check_redis(getattr(state, "redis_client", None))),
+        _probe("neo4j", _check_neo4j(getattr(state, "graph_service", None))),
+    )
+    services = {name: status for name, (status, _) in zip(_HEALTH_SERVICES, results, strict=True)}
+    latencies = {name: latency_ms for name, (_, latency_ms) in zip(_HEALTH_SERVICES, results, strict=True)}
+
+    # Required services determine overall status
+    required_ok = all(services.get(s) == "up" for s in ("elasticsearch", "postgres"))
+    content = {
+        "status": "healthy" if required_ok else "unhealthy",
+        "services": services,
+        "auth_required": settings.auth_required,
+    }
+    return content, 200 if required_ok else 503, latencies
+
+
+def _health_response(report: tuple[dict[str, Any], int, dict[str, float]], verbose: bool) -> ORJSONResponse:
+    content, status_code, latencies = report
+    if verbose:
+        content = {**content, "services_latency_ms": latencies}
+    return ORJSONResponse(content, status_code=status_code, headers=_HEALTH_HEADERS)
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="PAM Context API",
         description="Business Knowledge Layer for LLMs",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Middleware (order matters — outermost first)
@@ -348,69 +438,39 @@ def create_app() -> FastAPI:
 
     app.dependency_overrides[_get_glossary_svc] = _glossary_svc_override
 
+    # Kept on app.state so the cached report can be dropped without rebuilding the app.
+    app.state.health_cache = {"expires": 0.0, "report": None, "body": b""}
+    health_lock = asyncio.Lock()
+
     @app.get("/api/health")
     async def health(
         request: Request,
+        verbose: bool = False,
         es_client: AsyncElasticsearch = Depends(get_es_client),
         db: AsyncSession = Depends(get_db),
     ):
-        services: dict[str, str] = {}
-
-        # Check Elasticsearch
-        try:
-            if await es_client.ping():
-                services["elasticsearch"] = "up"
-            else:
-                services["elasticsearch"] = "down"
-        except Exception:
-            logger.warning("health_check_es_failed", exc_info=True)
-            services["elasticsearch"] = "down"
-
-        # Check PostgreSQL
-        try:
-            await db.execute(text("SELECT 1"))
-            services["postgres"] = "up"
-        except Exception:
-            logger.warning("health_check_pg_failed", exc_info=True)
-            services["postgres"] = "down"
-
-        # Check Redis
-        redis_client = getattr(request.app.state, "redis_client", None)
-        if redis_client:
-            try:
-                if await redis_client.ping():
-                    services["redis"] = "up"
-                else:
-                    services["redis"] = "down"
-            except Exception:
-                logger.warning("health_check_redis_failed", exc_info=True)
-                services["redis"] = "down"
-        else:
-            services["redis"] = "down"
-
-        # Check Neo4j
-        graph_service = getattr(request.app.state, "graph_service", None)
-        if graph_service:
-            try:
-                async with graph_service.client.driver.session() as session:
-                    await session.run("RETURN 1")
-                services["neo4j"] = "up"
-            except Exception:
-                logger.warning("health_check_neo4j_failed", exc_info=True)
-                services["neo4j"] = "down"
-        else:
-            services["neo4j"] = "down"
-
-        # Required services determine overall status
-        required_ok = all(services.get(s) == "up" for s in ("elasticsearch", "postgres"))
-        status_code = 200 if required_ok else 503
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "status": "healthy" if required_ok else "unhealthy",
-                "services": services,
-                "auth_required": settings.auth_required,
-            },
+        ttl = settings.health_cache_ttl
+        if ttl <= 0:
+            return _health_response(await _health_report(es_client, db, request.app.state), verbose)
+
+        # Bursts of load-balancer polls share one probe cycle instead of each hitting every backend.
+        health_cache: dict[str, Any] = request.app.state.health_cache
+        loop = asyncio.get_running_loop()
+        if loop.time() >= health_cache["expires"]:
+            async with health_lock:
+                if loop.time() >= health_cache["expires"]:
+                    report = await _health_report(es_client, db, request.app.state)
+                    health_cache["report"] = report
+                    health_cache["body"] = orjson.dumps(report[0])
+                    health_cache["expires"] = loop.time() + ttl
+        if verbose:
+            return _health_response(health_cache["report"], verbose)
+        # Cache hits reuse the serialised body as-is.
+        return Response(
+            health_cache["body"],
+            status_code=health_cache["report"][1],
+            media_type="application/json",
+            headers=_HEALTH_HEADERS,
         )
 
     return app
@@ -7,13 +7,15 @@ response body buffering that breaks SSE streaming.
 import time
 
 import structlog
-from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from pam.common.logging import set_correlation_id
 
 logger = structlog.get_logger()
 
+_CID_HEADER = b"x-correlation-id"
+_HTTP_RESPONSE_START = "http.response.start"
+
 
 class CorrelationIdMiddleware:
     """Sets a correlation ID on each HTTP request/response via contextvars.
@@ -33,16 +35,21 @@ class CorrelationIdMiddleware:
         # Extract X-Correlation-ID from raw ASGI headers (list of byte pairs)
         incoming_cid: str | None = None
         for header_name, header_value in scope.get("headers", []):
-            if header_name == b"x-correlation-id":
+            if header_name == _CID_HEADER:
                 incoming_cid = header_value.decode("latin-1")
                 break
 
         cid = set_correlation_id(incoming_cid)
+        cid_header = (_CID_HEADER, cid.encode("latin-1"))
 
         async def send_with_cid(message: Message) -> None:
-            if message["type"] == "http.response.start":
-                headers = MutableHeaders(scope=message)
-                headers.append("X-Correlation-ID", cid)
+            if message["type"] == _HTTP_RESPONSE_START:
+                # Append straight onto the raw header list rather than rebuilding it via MutableHeaders.
+                headers = message.get("headers")
+                if isinstance(headers, list):
+                    headers.append(cid_header)
+                else:
+                    message["headers"] = [*(headers or ()), cid_header]
             await send(message)
 
         await self.app(scope, receive, send_with_cid)
@@ -52,33 +59,36 @@ class RequestLoggingMiddleware:
     """Logs HTTP requests with method, path, status code, and latency.
 
     Pure ASGI middleware -- captures the status code from the response start
-    message without buffering the response body.
+    message without buffering the response body. Requests to ``skip_paths``
+    (by default the polled health check) are passed through unlogged.
     """
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(self, app: ASGIApp, skip_paths: frozenset[str] = frozenset({"/api/health"})) -> None:
         self.app = app
+        self.skip_paths = skip_paths
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
             await self.app(scope, receive, send)
             return
 
-        start = time.perf_counter()
+        start = time.monotonic_ns()
         status_code: int = 0
 
         async def send_with_status(message: Message) -> None:
             nonlocal status_code
-            if message["type"] == "http.response.start":
+            if message["type"] == _HTTP_RESPONSE_START:
                 status_code = message["status"]
             await send(message)
 
         await self.app(scope, receive, send_with_status)
 
-        latency_ms = (time.perf_counter() - start) * 1000
+        # Integer arithmetic on the clock; one division to keep the 0.1 ms latency_ms log field.
+        latency_ms = (time.monotonic_ns() - start) // 100_000 / 10
         logger.info(
             "http_request",
             method=scope["method"],
             path=scope["path"],
             status_code=status_code,
-            latency_ms=round(latency_ms, 1),
+            latency_ms=latency_ms,
         )
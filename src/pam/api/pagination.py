@@ -2,30 +2,95 @@
 
 import base64
 import json
+import struct
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import Label, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 T = TypeVar("T")
 
 DEFAULT_PAGE_SIZE = 50
 
+# Compact cursor for the common (UUID id, tz-aware timestamp) pair: a version byte,
+# the 16 raw UUID bytes and int64 microseconds since the epoch. Anything else falls
+# back to base64-encoded JSON, which never starts with the version byte.
+_BINARY_CURSOR_VERSION = b"\x01"
+_BINARY_CURSOR = struct.Struct("<16sq")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _pack_binary(last_id: str, sort_value: str) -> bytes | None:
+    """Pack the cursor fields, or return None if they would not round-trip exactly."""
+    try:
+        item_uuid = uuid.UUID(last_id)
+        sort_dt = datetime.fromisoformat(sort_value)
+    except ValueError:
+        return None
+    if str(item_uuid) != last_id or sort_dt.tzinfo is None:
+        return None
+    micros = (sort_dt - _EPOCH) // _ONE_MICROSECOND
+    if (_EPOCH + micros * _ONE_MICROSECOND).isoformat() != sort_value:
+        return None
+    return _BINARY_CURSOR_VERSION + _BINARY_CURSOR.pack(item_uuid.bytes, micros)
+
 
 def encode_cursor(last_id: str, sort_value: str) -> str:
     """Encode a pagination cursor from the last item's ID and sort value."""
-    payload = json.dumps({"id": last_id, "sv": sort_value}, sort_keys=True)
-    return base64.urlsafe_b64encode(payload.encode()).decode()
+    payload = _pack_binary(last_id, sort_value)
+    if payload is None:
+        payload = json.dumps({"id": last_id, "sv": sort_value}, sort_keys=True).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
 
 
 def decode_cursor(cursor: str) -> dict[str, Any]:
-    """Decode a pagination cursor into its ID and sort value components."""
-    raw = base64.urlsafe_b64decode(cursor.encode())
+    """Decode a pagination cursor into its ID and sort value components.
+
+    Raises ``ValueError`` for malformed cursors.
+    """
+    raw = base64.urlsafe_b64decode(cursor.encode() + b"=" * (-len(cursor) % 4))
+    if raw[:1] == _BINARY_CURSOR_VERSION and len(raw) == 1 + _BINARY_CURSOR.size:
+        id_bytes, micros = _BINARY_CURSOR.unpack(raw[1:])
+        try:
+            sort_dt = _EPOCH + micros * _ONE_MICROSECOND
+        except OverflowError as err:
+            raise ValueError("Cursor timestamp out of range") from err
+        return {"id": str(uuid.UUID(bytes=id_bytes)), "sv": sort_dt.isoformat()}
     decoded: dict[str, Any] = json.loads(raw)
     return decoded
 
 
+def total_column(model: type) -> Label[int]:
+    """Uncorrelated ``COUNT(*)`` over ``model``, selected as the last column of each page row.
+
+    Fetches the page and the total in one round trip. Unlike ``COUNT(*) OVER ()``
+    it ignores the keyset cursor filter, so later pages report the full total.
+    """
+    return select(func.count()).select_from(model).scalar_subquery().label("total")
+
+
+async def page_total(db: AsyncSession, model: type, rows: Sequence[Any], cursor: str) -> int:
+    """Read the total off the first page row, counting separately only for an empty cursor page."""
+    if rows:
+        total: int = rows[0][-1]
+        return total
+    if not cursor:
+        return 0
+    return (await db.execute(select(func.count()).select_from(model))).scalar() or 0
+
+
 class PaginatedResponse[T](BaseModel):
-    """Generic paginated response envelope."""
+    """Generic paginated response envelope.
+
+    Routes build it with ``model_construct``: the items are already validated
+    response models, and FastAPI validates the envelope against
+    ``response_model`` when serialising, so validating here too is redundant.
+    """
 
     items: list[T]
     total: int
@@ -1,10 +1,10 @@
 """Rate limiting setup using slowapi."""
 
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.requests import Request
-from starlette.responses import JSONResponse
 
 from pam.common.config import settings
 
@@ -20,8 +20,8 @@ limiter = Limiter(
 )
 
 
-def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:  # noqa: ARG001
-    return JSONResponse(
+def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> ORJSONResponse:  # noqa: ARG001
+    return ORJSONResponse(
         status_code=429,
         content={"detail": f"Rate limit exceeded: {exc.detail}"},
     )
@@ -6,13 +6,20 @@ from typing import cast
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import CursorResult, delete, func, or_, select
+from sqlalchemy import CursorResult, delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from pam.api.auth import require_admin
 from pam.api.deps import get_db
-from pam.api.pagination import DEFAULT_PAGE_SIZE, PaginatedResponse, decode_cursor, encode_cursor
+from pam.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+    page_total,
+    total_column,
+)
 from pam.common.models import (
     AssignRoleRequest,
     MessageResponse,
@@ -38,12 +45,8 @@ async def list_users(
     _admin: User | None = Depends(require_admin),
 ):
     """List all users with cursor-based pagination."""
-    # Count total
-    count_result = await db.execute(select(func.count()).select_from(User))
-    total = count_result.scalar() or 0
-
-    # Base query
-    stmt = select(User).order_by(User.created_at.desc(), User.id.desc())
+    # Base query, with the total count selected alongside each row
+    stmt = select(User, total_column(User)).order_by(User.created_at.desc(), User.id.desc())
 
     # Apply cursor filter for keyset pagination
     if cursor:
@@ -62,8 +65,9 @@ async def list_users(
 
     # Fetch limit + 1 to detect next page
     stmt = stmt.limit(limit + 1)
-    result = await db.execute(stmt)
-    users = list(result.scalars().all())
+    rows = (await db.execute(stmt)).all()
+    total = await page_total(db, User, rows, cursor)
+    users = [row[0] for row in rows]
 
     has_next = len(users) > limit
     users = users[:limit]
@@ -78,7 +82,7 @@ async def list_users(
             last_user.created_at.isoformat() if last_user.created_at else "",
         )
 
-    return PaginatedResponse(items=items, total=total, cursor=next_cursor)
+    return PaginatedResponse.model_construct(items=items, total=total, cursor=next_cursor)
 
 
 @router.get("/admin/users/{user_id}", response_model=UserWithRoles)
@@ -11,7 +11,14 @@ from sqlalchemy.orm import selectinload
 
 from pam.api.auth import get_current_user
 from pam.api.deps import get_db
-from pam.api.pagination import DEFAULT_PAGE_SIZE, PaginatedResponse, decode_cursor, encode_cursor
+from pam.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+    page_total,
+    total_column,
+)
 from pam.common.models import (
     Document,
     DocumentResponse,
@@ -35,15 +42,12 @@ async def list_documents(
     _user: User | None = Depends(get_current_user),
 ):
     """List all ingested documents with segment counts and cursor-based pagination."""
-    # Count total
-    count_result = await db.execute(select(func.count()).select_from(Document))
-    total = count_result.scalar() or 0
-
-    # Base query with segment counts
+    # Base query with segment counts and the total document count
     stmt = (
         select(
             Document,
             func.count(Segment.id).label("segment_count"),
+            total_column(Document),
         )
         .outerjoin(Segment)
         .group_by(Document.id)
@@ -69,6 +73,7 @@ async def list_documents(
     stmt = stmt.limit(limit + 1)
     result = await db.execute(stmt)
     rows = result.all()
+    total = await page_total(db, Document, rows, cursor)
 
     has_next = len(rows) > limit
     rows = rows[:limit]
@@ -87,7 +92,7 @@ async def list_documents(
             created_at=doc.created_at,
             segment_count=count,
         )
-        for doc, count in rows
+        for doc, count, _total in rows
     ]
 
     next_cursor = ""
@@ -98,7 +103,7 @@ async def list_documents(
             last_doc.updated_at.isoformat() if last_doc.updated_at else "",
         )
 
-    return PaginatedResponse(items=items, total=total, cursor=next_cursor)
+    return PaginatedResponse.model_construct(items=items, total=total, cursor=next_cursor)
 
 
 @router.get("/segments/{segment_id}", response_model=SegmentDetailResponse)
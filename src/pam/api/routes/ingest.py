@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 
 import structlog
 from elasticsearch import AsyncElasticsearch
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from pam.api.auth import get_current_user, require_admin
 from pam.api.deps import get_db, get_embedder, get_es_client, get_graph_service
-from pam.api.pagination import DEFAULT_PAGE_SIZE, PaginatedResponse, decode_cursor, encode_cursor
+from pam.api.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PaginatedResponse,
+    decode_cursor,
+    encode_cursor,
+    page_total,
+    total_column,
+)
 from pam.api.rate_limit import limiter
 from pam.common.config import settings
 from pam.common.models import (
@@ -42,9 +50,18 @@ logger = structlog.get_logger()
 router = APIRouter()
 
 
+@lru_cache(maxsize=8)
+def _resolved_ingest_root(ingest_root: str) -> Path:
+    """Resolve the configured ingestion root once per distinct setting value."""
+    return Path(ingest_root).resolve()
+
+
 class IngestFolderRequest(BaseModel):
     path: str
 
+    # Unknown keys are rejected rather than silently collected; pasted paths lose stray whitespace.
+    model_config = {"extra": "forbid", "str_strip_whitespace": True}
+
 
 class IngestGithubRequest(BaseModel):
     repo: str
@@ -73,7 +90,7 @@ async def ingest_folder(
     if not settings.ingest_root:
         raise HTTPException(status_code=400, detail="Ingestion root not configured")
 
-    root = Path(settings.ingest_root).resolve()
+    root = _resolved_ingest_root(settings.ingest_root)
     folder = Path(body.path).resolve()
     if not folder.is_relative_to(root):
         raise HTTPException(status_code=403, detail="Path outside allowed ingestion root")
@@ -120,12 +137,10 @@ async def list_task_statuses(
     _user: User | None = Depends(get_current_user),
 ):
     """List recent ingestion tasks with cursor-based pagination."""
-    # Count total
-    count_result = await db.execute(select(func.count()).select_from(IngestionTask))
-    total = count_result.scalar() or 0
-
-    # Base query
-    stmt = select(IngestionTask).order_by(IngestionTask.created_at.desc(), IngestionTask.id.desc())
+    # Base query, with the total count selected alongside each row
+    stmt = select(IngestionTask, total_column(IngestionTask)).order_by(
+        IngestionTask.created_at.desc(), IngestionTask.id.desc()
+    )
 
     # Apply cursor filter for keyset pagination
     if cursor:
@@ -144,8 +159,9 @@ async def list_task_statuses(
 
     # Fetch limit + 1 to detect next page
     stmt = stmt.limit(limit + 1)
-    result = await db.execute(stmt)
-    tasks = list(result.scalars().all())
+    rows = (await db.execute(stmt)).all()
+    total = await page_total(db, IngestionTask, rows, cursor)
+    tasks = [row[0] for row in rows]
 
     has_next = len(tasks) > limit
     tasks = tasks[:limit]
@@ -160,7 +176,7 @@ async def list_task_statuses(
             last_task.created_at.isoformat() if last_task.created_at else "",
         )
 
-    return PaginatedResponse(items=items, total=total, cursor=next_cursor)
+    return PaginatedResponse.model_construct(items=items, total=total, cursor=next_cursor)
 
 
 @router.post("/ingest/github", response_model=TaskCreatedResponse, status_code=202)
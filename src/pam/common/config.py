@@ -136,6 +136,8 @@ class Settings(BaseSettings):
 
     # App
     log_level: str = "INFO"
+    health_cache_ttl: float = 2.0  # Seconds to reuse /api/health probe results; 0 disables
+    health_es_slow_ms: float = 1000.0  # ES pings slower than this report "down"
     cors_origins: list[str] = ["http://localhost:5173"]
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
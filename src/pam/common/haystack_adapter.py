@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
+from functools import lru_cache
 
 from haystack import Document
+from pydantic import TypeAdapter
 
 from pam.common.models import KnowledgeSegment
 from pam.retrieval.types import SearchResult
 
+# Validates a whole retrieval page in one pydantic-core call rather than one per result.
+_SEARCH_RESULTS = TypeAdapter(list[SearchResult])
+
+
+@lru_cache(maxsize=4096)
+def _as_uuid(value: str) -> uuid.UUID:
+    """Parse a segment ID once; repeated retrievals over the same corpus return the same IDs."""
+    return uuid.UUID(value)
+
 
 def segment_to_haystack_doc(segment: KnowledgeSegment) -> Document:
     """Convert a PAM KnowledgeSegment to a Haystack Document for indexing."""
@@ -34,7 +46,7 @@ def haystack_doc_to_search_result(doc: Document, score: float | None = None) ->
     """Convert a Haystack Document (from retrieval) to a PAM SearchResult."""
     meta = doc.meta or {}
     return SearchResult(
-        segment_id=uuid.UUID(meta.get("segment_id", doc.id)),
+        segment_id=_as_uuid(meta.get("segment_id", doc.id)),
         content=doc.content or "",
         score=score if score is not None else (doc.score or 0.0),
         source_url=meta.get("source_url"),
@@ -43,3 +55,27 @@ def haystack_doc_to_search_result(doc: Document, score: float | None = None) ->
         document_title=meta.get("document_title"),
         segment_type=meta.get("segment_type", "text"),
     )
+
+
+def haystack_docs_to_search_results(docs: Iterable[Document]) -> list[SearchResult]:
+    """Convert a page of retrieved Haystack Documents, each scored by its own ``score``.
+
+    Same mapping as ``haystack_doc_to_search_result``, but the field dicts are
+    validated as one list, which is markedly cheaper for a full result page.
+    """
+    rows = []
+    for doc in docs:
+        meta = doc.meta or {}
+        rows.append(
+            {
+                "segment_id": _as_uuid(meta.get("segment_id", doc.id)),
+                "content": doc.content or "",
+                "score": doc.score or 0.0,
+                "source_url": meta.get("source_url"),
+                "source_id": meta.get("source_id"),
+                "section_path": meta.get("section_path"),
+                "document_title": meta.get("document_title"),
+                "segment_type": meta.get("segment_type", "text"),
+            }
+        )
+    return _SEARCH_RESULTS.validate_python(rows)
@@ -1,20 +1,36 @@
 """Structured logging with structlog, correlation IDs, and cost tracking."""
 
-import uuid
+import itertools
+import secrets
+import time
 from contextvars import ContextVar
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 import structlog
 
 correlation_id_var: ContextVar[str] = ContextVar("correlation_id", default="")
 
+# Correlation IDs only need to be unique, not unguessable. They are time-prefixed like
+# UUIDv7/ULID (42 bits of Unix milliseconds, then a 22-bit per-process sequence) so that
+# logs and any store indexing them see roughly ordered inserts instead of random ones.
+_CID_SEQ_BITS = 22
+_CID_SEED = secrets.randbits(_CID_SEQ_BITS)
+_cid_counter = itertools.count(1)
+
+
+def _new_correlation_id() -> str:
+    ms = time.time_ns() // 1_000_000
+    seq = (_CID_SEED + next(_cid_counter)) & ((1 << _CID_SEQ_BITS) - 1)
+    return f"{((ms << _CID_SEQ_BITS) | seq) & 0xFFFFFFFFFFFFFFFF:016x}"
+
 
 def get_correlation_id() -> str:
     return correlation_id_var.get()
 
 
 def set_correlation_id(cid: str | None = None) -> str:
-    cid = cid or uuid.uuid4().hex[:16]
+    cid = cid or _new_correlation_id()
     correlation_id_var.set(cid)
     return cid
 
@@ -46,6 +62,24 @@ def configure_logging(_log_level: str = "INFO") -> None:
     )
 
 
+# Approximate pricing per 1M tokens (as of 2025): (input, output)
+_LLM_PRICING = MappingProxyType(
+    {
+        "claude-sonnet-4-6": (3.0, 15.0),
+        "claude-opus-4-6": (15.0, 75.0),
+    }
+)
+_DEFAULT_LLM_MODEL = "claude-sonnet-4-6"
+# Embedding pricing per 1M input tokens
+_EMBEDDING_PRICING = MappingProxyType(
+    {
+        "text-embedding-3-large": 0.13,
+        "text-embedding-3-small": 0.02,
+    }
+)
+_DEFAULT_EMBEDDING_RATE = 0.13
+
+
 @dataclass
 class CostTracker:
     """Tracks LLM token usage and estimated cost per request."""
@@ -98,23 +132,15 @@ class CostTracker:
 
     @staticmethod
     def _estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-        # Approximate pricing per 1M tokens (as of 2025)
-        pricing = {
-            "claude-sonnet-4-6": {"input": 3.0, "output": 15.0},
-            "claude-opus-4-6": {"input": 15.0, "output": 75.0},
-        }
-        rates = pricing.get(model)
+        rates = _LLM_PRICING.get(model)
         if rates is None:
             log = structlog.get_logger()
             log.warning("unknown_model_cost", message=f"Unknown model '{model}': using default cost estimate")
-            rates = pricing["claude-sonnet-4-6"]
-        return (input_tokens * rates["input"] + output_tokens * rates["output"]) / 1_000_000
+            rates = _LLM_PRICING[_DEFAULT_LLM_MODEL]
+        input_rate, output_rate = rates
+        return (input_tokens * input_rate + output_tokens * output_rate) / 1_000_000
 
     @staticmethod
     def _estimate_embedding_cost(model: str, input_tokens: int) -> float:
-        pricing = {
-            "text-embedding-3-large": 0.13,  # per 1M tokens
-            "text-embedding-3-small": 0.02,
-        }
-        rate = pricing.get(model, 0.13)
+        rate = _EMBEDDING_PRICING.get(model, _DEFAULT_EMBEDDING_RATE)
         return input_tokens * rate / 1_000_000
@@ -16,7 +16,7 @@ from haystack_integrations.components.retrievers.elasticsearch import (
 from haystack_integrations.document_stores.elasticsearch import ElasticsearchDocumentStore
 
 from pam.common.cache import CacheService
-from pam.common.haystack_adapter import haystack_doc_to_search_result
+from pam.common.haystack_adapter import haystack_docs_to_search_results
 from pam.retrieval.types import SearchBackendError, SearchQuery, SearchResult
 
 logger = structlog.get_logger()
@@ -159,7 +159,7 @@ class HaystackSearchService:
         # Trim to top_k (joiner may return more)
         docs = docs[:top_k]
 
-        return [haystack_doc_to_search_result(doc) for doc in docs]
+        return haystack_docs_to_search_results(docs)
 
     async def search(
         self,
@@ -1,7 +1,10 @@
 """Shared test fixtures for the PAM Context test suite."""
 
+import asyncio
+import sys
 import uuid
-from unittest.mock import AsyncMock, MagicMock, Mock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -9,6 +12,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pam.common.models import KnowledgeSegment, RawDocument
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop (installed with ``uvicorn[standard]``) except on Windows."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture
 def mock_db_session():
     """Mock async SQLAlchemy session."""
@@ -38,13 +51,7 @@ def mock_es_client():
 def mock_openai_client():
     """Mock async OpenAI client."""
     client = AsyncMock()
-    embedding_data = Mock()
-    embedding_data.embedding = [0.1] * 1536
-    usage = Mock()
-    usage.total_tokens = 10
-    response = Mock()
-    response.data = [embedding_data]
-    response.usage = usage
+    response = SimpleNamespace(data=[SimpleNamespace(embedding=[0.1] * 1536)], usage=SimpleNamespace(total_tokens=10))
     client.embeddings = AsyncMock()
     client.embeddings.create = AsyncMock(return_value=response)
     return client
@@ -54,13 +61,11 @@ def mock_openai_client():
 def mock_anthropic_client():
     """Mock async Anthropic client."""
     client = AsyncMock()
-    text_block = Mock()
-    text_block.type = "text"
-    text_block.text = "This is the answer."
-    response = Mock()
-    response.content = [text_block]
-    response.stop_reason = "end_turn"
-    response.usage = Mock(input_tokens=100, output_tokens=50)
+    response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="This is the answer.")],
+        stop_reason="end_turn",
+        usage=SimpleNamespace(input_tokens=100, output_tokens=50),
+    )
     client.messages = AsyncMock()
     client.messages.create = AsyncMock(return_value=response)
     return client
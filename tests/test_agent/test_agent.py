@@ -1,6 +1,7 @@
 """Tests for RetrievalAgent — tool-use loop with mocked Anthropic + search."""
 
 import uuid
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from pam.agent.agent import RetrievalAgent
@@ -8,27 +9,19 @@ from pam.retrieval.types import SearchResult
 
 
 def _make_text_block(text):
-    block = Mock()
-    block.type = "text"
-    block.text = text
-    return block
+    return SimpleNamespace(type="text", text=text)
 
 
 def _make_tool_use_block(name, input_dict, tool_id="tool_1"):
-    block = Mock()
-    block.type = "tool_use"
-    block.name = name
-    block.input = input_dict
-    block.id = tool_id
-    return block
+    return SimpleNamespace(type="tool_use", name=name, input=input_dict, id=tool_id)
 
 
 def _make_response(content, stop_reason="end_turn", input_tokens=100, output_tokens=50):
-    resp = Mock()
-    resp.content = content
-    resp.stop_reason = stop_reason
-    resp.usage = Mock(input_tokens=input_tokens, output_tokens=output_tokens)
-    return resp
+    return SimpleNamespace(
+        content=content,
+        stop_reason=stop_reason,
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+    )
 
 
 class TestRetrievalAgent:
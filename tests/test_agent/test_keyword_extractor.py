@@ -1,6 +1,7 @@
 """Unit tests for keyword_extractor: .get() defaults, error paths, prompt, timeout."""
 
 import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -13,13 +14,8 @@ from pam.agent.keyword_extractor import (
 
 def _mock_client_returning(text: str) -> AsyncMock:
     """Build mock AsyncAnthropic client that returns the given text."""
-    mock_text_block = MagicMock()
-    mock_text_block.text = text
-    mock_response = MagicMock()
-    mock_response.content = [mock_text_block]
-
     client = AsyncMock()
-    client.messages.create = AsyncMock(return_value=mock_response)
+    client.messages.create = AsyncMock(return_value=SimpleNamespace(content=[SimpleNamespace(text=text)]))
     return client
 
 
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from pam.agent import query_classifier
 from pam.agent.query_classifier import (
     ClassificationResult,
     RetrievalMode,
@@ -35,13 +36,9 @@ def _default_settings() -> SimpleNamespace:
     )
 
 
-def _mock_llm_response(text: str) -> MagicMock:
-    """Build a mock Anthropic messages.create response."""
-    mock_block = MagicMock()
-    mock_block.text = text
-    mock_response = MagicMock()
-    mock_response.content = [mock_block]
-    return mock_response
+def _mock_llm_response(text: str) -> SimpleNamespace:
+    """Build a stand-in Anthropic messages.create response."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
 
 
 def _mock_es_response(total: int) -> dict:
@@ -246,18 +243,18 @@ class TestCheckEntityMentions:
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_no_vdb_store_skipped(self):
+    async def test_no_vdb_store_skipped(self, monkeypatch):
         """Passing vdb_store=None skips entity check entirely."""
         settings = _default_settings()
         settings.mode_llm_fallback_enabled = False
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            # "Tell me something" is ambiguous -> rules return hybrid 0.4
-            result = await classify_query_mode(
-                "Tell me something interesting",
-                client=None,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        # "Tell me something" is ambiguous -> rules return hybrid 0.4
+        result = await classify_query_mode(
+            "Tell me something interesting",
+            client=None,
+            vdb_store=None,
+        )
         # No vdb_store, no client -> default hybrid
         assert result.mode == RetrievalMode.HYBRID
         assert result.method == "default"
@@ -315,7 +312,7 @@ class TestLlmClassify:
         assert result.method == "llm"
 
     @pytest.mark.asyncio
-    async def test_llm_disabled_in_settings(self):
+    async def test_llm_disabled_in_settings(self, monkeypatch):
         """LLM fallback disabled -> never called even when rules are uncertain."""
         settings = _default_settings()
         settings.mode_llm_fallback_enabled = False
@@ -325,12 +322,12 @@ class TestLlmClassify:
             return_value=_mock_llm_response('{"mode": "entity", "confidence": 0.95}')
         )
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "Tell me something interesting",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "Tell me something interesting",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         # Rules return hybrid 0.4, LLM is disabled -> default
         mock_client.messages.create.assert_not_called()
@@ -345,25 +342,25 @@ class TestLlmClassify:
 
 class TestClassifyQueryMode:
     @pytest.mark.asyncio
-    async def test_rules_confident_no_llm_called(self):
+    async def test_rules_confident_no_llm_called(self, monkeypatch):
         """When rules are confident, LLM is never called."""
         settings = _default_settings()
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock()
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "When did the deployment change recently?",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "When did the deployment change recently?",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         assert result.mode == RetrievalMode.TEMPORAL
         assert result.method == "rules"
         mock_client.messages.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_rules_uncertain_llm_called(self):
+    async def test_rules_uncertain_llm_called(self, monkeypatch):
         """Ambiguous query with uncertain rules -> LLM called."""
         settings = _default_settings()
         mock_client = AsyncMock()
@@ -371,19 +368,19 @@ class TestClassifyQueryMode:
             return_value=_mock_llm_response('{"mode": "conceptual", "confidence": 0.85}')
         )
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "Tell me something interesting about the system",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "Tell me something interesting about the system",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         mock_client.messages.create.assert_called_once()
         assert result.mode == RetrievalMode.CONCEPTUAL
         assert result.method == "llm"
 
     @pytest.mark.asyncio
-    async def test_entity_check_confident_no_llm_called(self):
+    async def test_entity_check_confident_no_llm_called(self, monkeypatch):
         """Entity ES lookup confident -> LLM not called."""
         settings = _default_settings()
         mock_client = AsyncMock()
@@ -394,20 +391,20 @@ class TestClassifyQueryMode:
         mock_store.client.search = AsyncMock(return_value=_mock_es_response(1))
         mock_store.entity_index = "pam_entities"
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            # Query has ambiguous rules but mentions entity name
-            result = await classify_query_mode(
-                "Tell me about Auth Service performance",
-                client=mock_client,
-                vdb_store=mock_store,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        # Query has ambiguous rules but mentions entity name
+        result = await classify_query_mode(
+            "Tell me about Auth Service performance",
+            client=mock_client,
+            vdb_store=mock_store,
+        )
 
         assert result.mode == RetrievalMode.ENTITY
         assert result.confidence == 0.85
         mock_client.messages.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_all_uncertain_defaults_hybrid(self):
+    async def test_all_uncertain_defaults_hybrid(self, monkeypatch):
         """Rules uncertain, no vdb_store, LLM low confidence -> hybrid default."""
         settings = _default_settings()
         mock_client = AsyncMock()
@@ -415,25 +412,23 @@ class TestClassifyQueryMode:
             return_value=_mock_llm_response('{"mode": "entity", "confidence": 0.3}')
         )
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "Tell me something interesting",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "Tell me something interesting",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         assert result.mode == RetrievalMode.HYBRID
         assert result.method == "default"
 
     @pytest.mark.asyncio
-    async def test_logging_called(self):
+    async def test_logging_called(self, monkeypatch):
         """Verify structlog.info is called with query_mode_classified event."""
         settings = _default_settings()
 
-        with (
-            patch("pam.agent.query_classifier.get_settings", return_value=settings),
-            patch("pam.agent.query_classifier.logger") as mock_logger,
-        ):
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        with patch("pam.agent.query_classifier.logger") as mock_logger:
             await classify_query_mode(
                 "When did the deployment change?",
                 client=None,
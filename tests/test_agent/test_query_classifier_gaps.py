@@ -8,10 +8,11 @@ full pipeline integration under non-default configurations.
 from __future__ import annotations
 
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from pam.agent import query_classifier
 from pam.agent.query_classifier import (
     ClassificationResult,
     RetrievalMode,
@@ -39,13 +40,9 @@ def _default_settings() -> SimpleNamespace:
     )
 
 
-def _mock_llm_response(text: str) -> MagicMock:
-    """Build a mock Anthropic messages.create response."""
-    mock_block = MagicMock()
-    mock_block.text = text
-    mock_response = MagicMock()
-    mock_response.content = [mock_block]
-    return mock_response
+def _mock_llm_response(text: str) -> SimpleNamespace:
+    """Build a stand-in Anthropic messages.create response."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
 
 
 def _mock_es_response(total: int) -> dict:
@@ -264,7 +261,7 @@ class TestClassifyQueryModeIntegration:
     """Integration edge cases for the full classify_query_mode pipeline."""
 
     @pytest.mark.asyncio
-    async def test_entity_check_below_high_threshold_triggers_llm(self):
+    async def test_entity_check_below_high_threshold_triggers_llm(self, monkeypatch):
         """Entity ES match (0.85) below high threshold (0.95) triggers LLM fallback."""
         settings = _default_settings()
         settings.mode_confidence_threshold = 0.95  # Very high threshold
@@ -279,12 +276,12 @@ class TestClassifyQueryModeIntegration:
         mock_store.client.search = AsyncMock(return_value=_mock_es_response(1))
         mock_store.entity_index = "pam_entities"
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "Tell me about Auth Service",
-                client=mock_client,
-                vdb_store=mock_store,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "Tell me about Auth Service",
+            client=mock_client,
+            vdb_store=mock_store,
+        )
 
         # Entity check returns 0.85 which is < 0.95 threshold, so LLM is called
         mock_client.messages.create.assert_called_once()
@@ -292,7 +289,7 @@ class TestClassifyQueryModeIntegration:
         assert result.method == "llm"
 
     @pytest.mark.asyncio
-    async def test_low_threshold_accepts_rules_easily(self):
+    async def test_low_threshold_accepts_rules_easily(self, monkeypatch):
         """With threshold=0.3, even a low-confidence rule-based match is accepted."""
         settings = _default_settings()
         settings.mode_confidence_threshold = 0.3
@@ -300,20 +297,20 @@ class TestClassifyQueryModeIntegration:
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock()
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            # Ambiguous query returns hybrid 0.4 from rules, which is > 0.3 threshold
-            result = await classify_query_mode(
-                "Tell me something interesting",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        # Ambiguous query returns hybrid 0.4 from rules, which is > 0.3 threshold
+        result = await classify_query_mode(
+            "Tell me something interesting",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         # Rules return 0.4 which is above 0.3 threshold -> accepted
         assert result.method == "rules"
         mock_client.messages.create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_llm_below_threshold_falls_to_default(self):
+    async def test_llm_below_threshold_falls_to_default(self, monkeypatch):
         """LLM returns valid mode but below threshold -> falls through to hybrid default."""
         settings = _default_settings()
         settings.mode_confidence_threshold = 0.7
@@ -323,12 +320,12 @@ class TestClassifyQueryModeIntegration:
             return_value=_mock_llm_response('{"mode": "entity", "confidence": 0.5}')
         )
 
-        with patch("pam.agent.query_classifier.get_settings", return_value=settings):
-            result = await classify_query_mode(
-                "Tell me something interesting",
-                client=mock_client,
-                vdb_store=None,
-            )
+        monkeypatch.setattr(query_classifier, "get_settings", lambda: settings)
+        result = await classify_query_mode(
+            "Tell me something interesting",
+            client=mock_client,
+            vdb_store=None,
+        )
 
         # Rules return 0.4, LLM returns 0.5, both below 0.7 -> default
         mock_client.messages.create.assert_called_once()
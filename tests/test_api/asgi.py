@@ -0,0 +1,58 @@
+"""Direct ASGI invocation for API tests that only check status codes and small JSON bodies.
+
+``asgi_call`` drives the app with a hand-built HTTP scope, skipping the request
+serialisation and response buffering that ``httpx.ASGITransport`` does. Tests
+that exercise headers, streaming or cookies should keep using the ``client``
+fixture.
+"""
+
+from typing import Any
+
+import orjson
+
+
+async def asgi_call(app: Any, method: str, path: str, body: Any = None) -> tuple[int, dict[str, str], bytes]:
+    """Send one request straight to ``app`` and return ``(status, headers, body)``.
+
+    ``path`` may carry a query string (``/api/x?y=1``); it is split off into the scope.
+    """
+    path, _, query = path.partition("?")
+    headers = [(b"host", b"test")]
+    payload = b""
+    if body is not None:
+        payload = orjson.dumps(body)
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(payload)).encode())]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "server": ("test", 80),
+        "client": ("127.0.0.1", 50000),
+        "root_path": "",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+    }
+    messages = [{"type": "http.request", "body": payload, "more_body": False}]
+
+    async def receive():
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    status = 0
+    response_headers: dict[str, str] = {}
+    chunks: list[bytes] = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode(), v.decode()) for k, v in message.get("headers", ()))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
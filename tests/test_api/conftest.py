@@ -1,15 +1,20 @@
 """API test fixtures — TestClient with dependency overrides."""
 
+from collections import deque
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
 from pam.agent.agent import AgentResponse, RetrievalAgent
 from pam.api.deps import get_agent, get_db, get_embedder, get_es_client, get_search_service
 from pam.api.main import create_app
+from pam.common.config import get_settings
 from pam.ingestion.embedders.openai_embedder import OpenAIEmbedder
 from pam.retrieval.hybrid_search import HybridSearchService
+from tests.test_api.rows import FakeResult
 
 
 @pytest.fixture
@@ -53,33 +58,113 @@ def mock_api_db_session():
     return session
 
 
+class FakeAsyncSession:
+    """``AsyncSession`` double: ``execute`` answers with the next queued result, ``get`` reads ``objects``."""
+
+    def __init__(self) -> None:
+        self._queue: deque[FakeResult] = deque()
+        self.statements: list[Any] = []
+        self.objects: dict[tuple[type, Any], Any] = {}
+        self.added: list[Any] = []
+
+    def queue(self, *results: FakeResult) -> None:
+        self._queue.extend(results)
+
+    async def execute(self, stmt: Any, *args: Any, **kwargs: Any) -> FakeResult:
+        self.statements.append(stmt)
+        return self._queue.popleft()
+
+    async def get(self, model: type, ident: Any) -> Any:
+        return self.objects.get((model, ident))
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    async def commit(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_db(app):
+    """Queue-backed ``FakeAsyncSession`` installed as the ``get_db`` dependency."""
+    session = FakeAsyncSession()
+    app.dependency_overrides[get_db] = lambda: session
+    return session
+
+
 @pytest.fixture
 def mock_api_es_client():
     return AsyncMock()
 
 
 @pytest.fixture
-def app(mock_agent, mock_search_service, mock_api_embedder, mock_api_db_session, mock_api_es_client):
-    """Create app with all dependencies overridden."""
-    application = create_app()
-    application.dependency_overrides[get_agent] = lambda: mock_agent
-    application.dependency_overrides[get_search_service] = lambda: mock_search_service
-    application.dependency_overrides[get_embedder] = lambda: mock_api_embedder
-    application.dependency_overrides[get_db] = lambda: mock_api_db_session
-    application.dependency_overrides[get_es_client] = lambda: mock_api_es_client
+def auth_enabled(monkeypatch):
+    """Turn on ``settings.auth_required`` for the duration of a test."""
+    monkeypatch.setattr(get_settings(), "auth_required", True)
+
+
+@pytest.fixture
+def auth_disabled(monkeypatch):
+    """Turn off ``settings.auth_required`` for the duration of a test."""
+    monkeypatch.setattr(get_settings(), "auth_required", False)
 
-    # Set app.state attributes used by routes/health that read directly from app.state
-    application.state.session_factory = MagicMock()
-    application.state.cache_service = None
-    application.state.redis_client = None
-    application.state.graph_service = None
 
-    return application
+@pytest.fixture(scope="session")
+def shared_app():
+    """Build the FastAPI app once per session; per-test wiring happens in ``app``."""
+    return create_app()
 
 
 @pytest.fixture
-async def client(app):
-    """Async test client that bypasses lifespan."""
-    transport = ASGITransport(app=app)
+def app(
+    shared_app, mock_agent, mock_search_service, mock_api_embedder, mock_api_db_session, mock_api_es_client, monkeypatch
+):
+    """Override all dependencies on the shared app, restoring its overrides and state afterwards."""
+    # Every health request probes afresh; tests opt into caching explicitly.
+    monkeypatch.setattr(get_settings(), "health_cache_ttl", 0.0)
+    saved_overrides = dict(shared_app.dependency_overrides)
+    saved_state = dict(shared_app.state._state)
+
+    shared_app.dependency_overrides[get_agent] = lambda: mock_agent
+    shared_app.dependency_overrides[get_search_service] = lambda: mock_search_service
+    shared_app.dependency_overrides[get_embedder] = lambda: mock_api_embedder
+    shared_app.dependency_overrides[get_db] = lambda: mock_api_db_session
+    shared_app.dependency_overrides[get_es_client] = lambda: mock_api_es_client
+
+    # Set app.state attributes used by routes/health that read directly from app.state
+    shared_app.state.session_factory = MagicMock()
+    shared_app.state.cache_service = None
+    shared_app.state.redis_client = None
+    shared_app.state.graph_service = None
+    # Fresh health cache, so a test's cached report never leaks into the next one
+    shared_app.state.health_cache = {"expires": 0.0, "report": None, "body": b""}
+
+    yield shared_app
+
+    shared_app.dependency_overrides.clear()
+    shared_app.dependency_overrides.update(saved_overrides)
+    shared_app.state._state.clear()
+    shared_app.state._state.update(saved_state)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_client(shared_app):
+    """Async client over the shared app, opened once per session (bypasses lifespan)."""
+    transport = ASGITransport(app=shared_app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture
+def client(app, shared_client):
+    """Shared async client, with this test's dependency overrides installed on the app.
+
+    Cookies and default headers are reset afterwards so nothing carries over between tests.
+    """
+    headers = shared_client.headers.copy()
+    yield shared_client
+    shared_client.cookies.clear()
+    shared_client.headers = headers
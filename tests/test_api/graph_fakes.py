@@ -0,0 +1,47 @@
+"""Lightweight Neo4j driver fakes for routes that read ``app.state.graph_service.client.driver``."""
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+
+class FakeResult:
+    """Minimal Neo4j result: ``data()`` and ``single()`` return prebuilt values."""
+
+    def __init__(self, data=None, single=None):
+        self._data = data
+        self._single = single
+
+    async def data(self):
+        return self._data
+
+    async def single(self):
+        return self._single
+
+
+class FakeSession:
+    """Neo4j session whose ``run()`` calls return the given results in order."""
+
+    def __init__(self, results):
+        self._it = iter(results)
+
+    async def run(self, *args, **kwargs):
+        return next(self._it)
+
+
+class FakeDriver:
+    """Neo4j driver yielding a ``FakeSession``, or raising ``error`` on session entry."""
+
+    def __init__(self, results=(), error=None):
+        self._results = results
+        self._error = error
+
+    @asynccontextmanager
+    async def session(self):
+        if self._error is not None:
+            raise self._error
+        yield FakeSession(self._results)
+
+
+def graph_service(driver):
+    """Wrap a driver in the ``graph_service.client.driver`` shape the routes read."""
+    return SimpleNamespace(client=SimpleNamespace(driver=driver))
@@ -0,0 +1,20 @@
+"""Small shared helpers for API tests."""
+
+import itertools
+import uuid
+from typing import Any
+
+import httpx
+import orjson
+
+_uuid_counter = itertools.count(1)
+
+
+def fast_uuid() -> uuid.UUID:
+    """Return a unique, deterministic UUID without touching ``os.urandom``."""
+    return uuid.UUID(int=next(_uuid_counter))
+
+
+def rjson(response: httpx.Response) -> Any:
+    """Decode ``response``'s JSON body with orjson."""
+    return orjson.loads(response.content)
@@ -0,0 +1,71 @@
+"""Plain row doubles for ORM objects returned by mocked ``db.execute`` results.
+
+Routes only read these by attribute name, so slotted dataclasses stand in for
+``Document``/``Segment``/``IngestionTask`` rows without ``Mock`` bookkeeping.
+``FakeResult`` likewise stands in for the ``Result`` a session returns; the
+``fake_db`` fixture queues them on a session double.
+"""
+
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, NamedTuple
+
+
+@dataclass(slots=True)
+class DocRow:
+    id: uuid.UUID
+    title: str
+    source_type: str = "markdown"
+    source_id: str = "/test.md"
+    source_url: str | None = None
+    owner: str | None = None
+    status: str = "active"
+    content_hash: str = "abc"
+    last_synced_at: datetime | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class SegRow:
+    id: uuid.UUID
+    document_id: uuid.UUID
+    content: str
+    segment_type: str = "text"
+    section_path: str | None = None
+    position: int = 0
+    metadata_: dict[str, Any] | None = None
+    document: DocRow | None = None
+
+
+@dataclass(slots=True)
+class TaskRow:
+    id: uuid.UUID
+    status: str
+    folder_path: str
+    total_documents: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    created_at: datetime | None = None
+    completed_at: datetime | None = None
+
+
+class FakeResult(NamedTuple):
+    """The ``Result`` surface routes read: ``all()``/``scalars()`` rows or a single scalar."""
+
+    rows: Sequence[Any] = ()
+    scalar_value: Any = None
+
+    def all(self) -> list[Any]:
+        return list(self.rows)
+
+    def scalars(self) -> "FakeResult":
+        return FakeResult(rows=[row[0] for row in self.rows])
+
+    def scalar(self) -> Any:
+        return self.scalar_value
+
+    def scalar_one_or_none(self) -> Any:
+        return self.scalar_value
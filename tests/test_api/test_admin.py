@@ -2,9 +2,11 @@
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 from pam.common.models import Project, User
+from tests.test_api.helpers import rjson
+from tests.test_api.rows import FakeResult
 
 
 class TestGetUser:
@@ -23,7 +25,7 @@ class TestGetUser:
         user.project_roles = roles or []
         return user
 
-    async def test_get_user_found(self, client, mock_api_db_session):
+    async def test_get_user_found(self, client, fake_db):
         """GET /admin/users/{user_id} returns user with roles."""
         user_id = uuid.uuid4()
         project_id = uuid.uuid4()
@@ -36,46 +38,40 @@ class TestGetUser:
 
         user = self._make_mock_user(user_id, roles=[role])
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = user
-        mock_api_db_session.execute = AsyncMock(return_value=mock_result)
+        fake_db.queue(FakeResult(scalar_value=user))
 
         response = await client.get(f"/api/admin/users/{user_id}")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["email"] == "detail@test.com"
         assert data["name"] == "Detail User"
         assert len(data["roles"]) == 1
         assert data["roles"][0]["project_name"] == "Test Project"
         assert data["roles"][0]["role"] == "editor"
 
-    async def test_get_user_not_found(self, client, mock_api_db_session):
+    async def test_get_user_not_found(self, client, fake_db):
         """GET /admin/users/{user_id} returns 404 for unknown user."""
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_api_db_session.execute = AsyncMock(return_value=mock_result)
+        fake_db.queue(FakeResult())
 
         response = await client.get(f"/api/admin/users/{uuid.uuid4()}")
         assert response.status_code == 404
-        assert "User not found" in response.json()["detail"]
+        assert "User not found" in rjson(response)["detail"]
 
-    async def test_get_user_no_roles(self, client, mock_api_db_session):
+    async def test_get_user_no_roles(self, client, fake_db):
         """GET /admin/users/{user_id} returns empty roles list for user without roles."""
         user_id = uuid.uuid4()
         user = self._make_mock_user(user_id, email="noroles@test.com", name="No Roles", roles=[])
 
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = user
-        mock_api_db_session.execute = AsyncMock(return_value=mock_result)
+        fake_db.queue(FakeResult(scalar_value=user))
 
         response = await client.get(f"/api/admin/users/{user_id}")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["roles"] == []
 
 
 class TestListUsers:
-    async def test_returns_users(self, client, mock_api_db_session):
+    async def test_returns_users(self, client, fake_db):
         user = User(
             id=uuid.uuid4(),
             email="user@test.com",
@@ -84,47 +80,28 @@ class TestListUsers:
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
         )
-        # First call: count query
-        count_result = MagicMock()
-        count_result.scalar.return_value = 1
-
-        # Second call: users query
-        user_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = [user]
-        user_result.scalars.return_value = mock_scalars
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, user_result])
+        # One query: users with the total count
+        fake_db.queue(FakeResult(rows=[(user, 1)]))
 
         response = await client.get("/api/admin/users")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["total"] == 1
         assert len(data["items"]) == 1
         assert data["items"][0]["email"] == "user@test.com"
 
-    async def test_empty_list(self, client, mock_api_db_session):
-        count_result = MagicMock()
-        count_result.scalar.return_value = 0
-
-        user_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        user_result.scalars.return_value = mock_scalars
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, user_result])
+    async def test_empty_list(self, client, fake_db):
+        fake_db.queue(FakeResult())
 
         response = await client.get("/api/admin/users")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["items"] == []
         assert data["total"] == 0
 
 
 class TestAssignRole:
-    async def test_assign_role_user_not_found(self, client, mock_api_db_session):
-        mock_api_db_session.get = AsyncMock(return_value=None)
-
+    async def test_assign_role_user_not_found(self, client, fake_db):
         response = await client.post(
             "/api/admin/roles",
             json={
@@ -146,27 +123,18 @@ class TestAssignRole:
         )
         assert response.status_code == 422  # Pydantic validation error
 
-    async def test_assign_role_success(self, client, mock_api_db_session):
+    async def test_assign_role_success(self, client, fake_db):
         user_id = uuid.uuid4()
         project_id = uuid.uuid4()
 
         user = User(id=user_id, email="u@t.com", name="U")
         project = Project(id=project_id, name="P")
 
-        async def mock_get(cls, id_):
-            if cls is User:
-                return user
-            if cls is Project:
-                return project
-            return None
-
-        mock_api_db_session.get = mock_get
+        fake_db.objects[User, user_id] = user
+        fake_db.objects[Project, project_id] = project
 
         # No existing role found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_api_db_session.execute = AsyncMock(return_value=mock_result)
-        mock_api_db_session.add = MagicMock()
+        fake_db.queue(FakeResult())
 
         response = await client.post(
             "/api/admin/roles",
@@ -177,19 +145,19 @@ class TestAssignRole:
             },
         )
         assert response.status_code == 201
-        assert response.json()["role"] == "editor"
+        assert rjson(response)["role"] == "editor"
+        assert [(r.user_id, r.project_id, r.role) for r in fake_db.added] == [(user_id, project_id, "editor")]
 
 
 class TestDeactivateUser:
-    async def test_deactivate_not_found(self, client, mock_api_db_session):
-        mock_api_db_session.get = AsyncMock(return_value=None)
+    async def test_deactivate_not_found(self, client, fake_db):
         response = await client.patch(f"/api/admin/users/{uuid.uuid4()}/deactivate")
         assert response.status_code == 404
 
-    async def test_deactivate_success(self, client, mock_api_db_session):
+    async def test_deactivate_success(self, client, fake_db):
         user_id = uuid.uuid4()
         user = User(id=user_id, email="u@t.com", name="U", is_active=True)
-        mock_api_db_session.get = AsyncMock(return_value=user)
+        fake_db.objects[User, user_id] = user
 
         response = await client.patch(f"/api/admin/users/{user_id}/deactivate")
         assert response.status_code == 200
@@ -197,8 +165,7 @@ class TestDeactivateUser:
 
 
 class TestRoleValidation:
-    async def test_viewer_role_accepted(self, client, mock_api_db_session):
-        mock_api_db_session.get = AsyncMock(return_value=None)
+    async def test_viewer_role_accepted(self, client, fake_db):
         response = await client.post(
             "/api/admin/roles",
             json={"user_id": str(uuid.uuid4()), "project_id": str(uuid.uuid4()), "role": "viewer"},
@@ -206,26 +173,16 @@ class TestRoleValidation:
         # Should not fail validation (404 for user not found is expected)
         assert response.status_code != 422
 
-    async def test_editor_role_accepted(self, client, mock_api_db_session):
-        mock_api_db_session.get = AsyncMock(return_value=None)
+    async def test_editor_role_accepted(self, client, fake_db):
         response = await client.post(
             "/api/admin/roles",
             json={"user_id": str(uuid.uuid4()), "project_id": str(uuid.uuid4()), "role": "editor"},
         )
         assert response.status_code != 422
 
-    async def test_admin_role_accepted(self, client, mock_api_db_session):
-        mock_api_db_session.get = AsyncMock(return_value=None)
+    async def test_admin_role_accepted(self, client, fake_db):
         response = await client.post(
             "/api/admin/roles",
             json={"user_id": str(uuid.uuid4()), "project_id": str(uuid.uuid4()), "role": "admin"},
         )
         assert response.status_code != 422
-
-
-class TestListUsersCursorValidation:
-    async def test_list_users_invalid_cursor_returns_400(self, client):
-        """Invalid base64 cursor → 400 with 'Invalid cursor' (B904 exception chaining)."""
-        response = await client.get("/api/admin/users?cursor=not-valid-base64!!!")
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Invalid cursor"
@@ -1,8 +1,12 @@
 """Tests for JWT auth, token creation/validation, and auth dependencies."""
 
+import functools
+import sys
+import types
 import uuid
+from contextlib import contextmanager
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import jwt
 import pytest
@@ -18,17 +22,79 @@ from pam.api.auth import (
 )
 from pam.common.config import settings
 from pam.common.models import User
+from tests.test_api.helpers import fast_uuid, rjson
+
+
+def _build_fake_google_modules() -> dict[str, types.ModuleType]:
+    """Module objects standing in for the google-auth packages the /auth/google route imports."""
+    names = (
+        "google",
+        "google.auth",
+        "google.auth.transport",
+        "google.auth.transport.requests",
+        "google.oauth2",
+        "google.oauth2.id_token",
+    )
+    modules = {name: types.ModuleType(name) for name in names}
+    # Wire parents to children so `from google.oauth2 import id_token` resolves to the fakes
+    for name, module in modules.items():
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(modules[parent], child, module)
+    modules["google.auth.transport.requests"].Request = object
+    return modules
+
+
+_FAKE_GOOGLE_MODULES = _build_fake_google_modules()
+
+
+@contextmanager
+def _fake_google_auth(fake_idinfo=None, side_effect=None):
+    """Install the prebuilt google-auth fakes into sys.modules for the duration of the block.
+
+    The google auth imports are lazy (inside the endpoint function body), so the modules
+    must be present in sys.modules when `from google.oauth2 import id_token` executes.
+    """
+
+    def verify_oauth2_token(*args, **kwargs):
+        if side_effect is not None:
+            raise side_effect
+        return fake_idinfo
+
+    _FAKE_GOOGLE_MODULES["google.oauth2.id_token"].verify_oauth2_token = verify_oauth2_token
+    saved = {name: sys.modules.get(name) for name in _FAKE_GOOGLE_MODULES}
+    sys.modules.update(_FAKE_GOOGLE_MODULES)
+    try:
+        yield
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+@pytest.fixture(scope="module")
+def signed_token():
+    """Sign a (user_id, token) pair for ``email``, once per email per module, for tests that only exercise decoding."""
+
+    @functools.cache
+    def _sign(email: str) -> tuple[uuid.UUID, str]:
+        user_id = fast_uuid()
+        return user_id, create_access_token(user_id, email)
+
+    return _sign
 
 
 class TestCreateAccessToken:
     def test_creates_valid_token(self):
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         token = create_access_token(user_id, "test@example.com")
         assert isinstance(token, str)
         assert len(token) > 0
 
     def test_token_contains_claims(self):
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         token = create_access_token(user_id, "test@example.com")
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         assert payload["sub"] == str(user_id)
@@ -37,7 +103,7 @@ class TestCreateAccessToken:
         assert "iat" in payload
 
     def test_token_expiry(self):
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         token = create_access_token(user_id, "test@example.com")
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
         exp = datetime.fromtimestamp(payload["exp"], tz=UTC)
@@ -47,14 +113,14 @@ class TestCreateAccessToken:
 
 class TestDecodeAccessToken:
     def test_decode_valid_token(self):
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         token = create_access_token(user_id, "test@example.com")
         payload = decode_access_token(token)
         assert payload["sub"] == str(user_id)
 
     def test_decode_expired_token(self):
         payload = {
-            "sub": str(uuid.uuid4()),
+            "sub": str(fast_uuid()),
             "email": "test@example.com",
             "iat": datetime.now(UTC) - timedelta(hours=48),
             "exp": datetime.now(UTC) - timedelta(hours=24),
@@ -72,7 +138,7 @@ class TestDecodeAccessToken:
 
     def test_decode_wrong_secret(self):
         payload = {
-            "sub": str(uuid.uuid4()),
+            "sub": str(fast_uuid()),
             "email": "test@example.com",
             "iat": datetime.now(UTC),
             "exp": datetime.now(UTC) + timedelta(hours=24),
@@ -90,8 +156,8 @@ class TestGetUserProjectIds:
 
     def test_returns_project_ids(self):
         user = MagicMock()
-        pid1 = uuid.uuid4()
-        pid2 = uuid.uuid4()
+        pid1 = fast_uuid()
+        pid2 = fast_uuid()
         role1 = MagicMock()
         role1.project_id = pid1
         role2 = MagicMock()
@@ -112,7 +178,7 @@ class TestDevLoginEndpoint:
     async def test_dev_login_creates_user(self, client, mock_api_db_session):
         """Dev login should work when auth_required=False."""
 
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         now = datetime.now(UTC)
 
         # Mock: no existing user found
@@ -134,17 +200,15 @@ class TestDevLoginEndpoint:
 
         response = await client.post("/api/auth/dev-login", json={"email": "dev@test.com"})
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "access_token" in data
         assert data["token_type"] == "bearer"  # noqa: S105
         assert data["user"]["email"] == "dev@test.com"
 
     async def test_dev_login_existing_user(self, client, mock_api_db_session):
         """Dev login with existing user should return token."""
-        from pam.common.models import User
-
         user = User(
-            id=uuid.uuid4(),
+            id=fast_uuid(),
             email="dev@test.com",
             name="Dev User",
             is_active=True,
@@ -158,28 +222,29 @@ class TestDevLoginEndpoint:
 
         response = await client.post("/api/auth/dev-login", json={"email": "dev@test.com"})
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "access_token" in data
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_dev_login_blocked_in_production(self, client):
         """Dev login should be blocked when auth_required=True."""
-        with patch.object(settings, "auth_required", True):
-            response = await client.post("/api/auth/dev-login", json={"email": "dev@test.com"})
-            assert response.status_code == 403
+        response = await client.post("/api/auth/dev-login", json={"email": "dev@test.com"})
+        assert response.status_code == 403
 
 
 class TestGetCurrentUser:
     """Tests for the get_current_user dependency."""
 
+    @pytest.mark.usefixtures("auth_disabled")
     async def test_returns_none_when_auth_disabled(self):
         """When auth_required=False, get_current_user returns None."""
-        with patch.object(settings, "auth_required", False):
-            result = await get_current_user(db=AsyncMock(), credentials=None)
-            assert result is None
+        result = await get_current_user(db=AsyncMock(), credentials=None)
+        assert result is None
 
-    async def test_returns_user_with_valid_token(self, mock_api_db_session):
+    @pytest.mark.usefixtures("auth_enabled")
+    async def test_returns_user_with_valid_token(self, mock_api_db_session, signed_token):
         """Valid Bearer token resolves to the corresponding user."""
-        user_id = uuid.uuid4()
+        user_id, token = signed_token("test@example.com")
         user = User(
             id=user_id,
             email="test@example.com",
@@ -194,26 +259,25 @@ class TestGetCurrentUser:
         mock_result.scalar_one_or_none.return_value = user
         mock_api_db_session.execute = AsyncMock(return_value=mock_result)
 
-        token = create_access_token(user_id, "test@example.com")
         creds = MagicMock()
         creds.credentials = token
 
-        with patch.object(settings, "auth_required", True):
-            result = await get_current_user(db=mock_api_db_session, credentials=creds)
-            assert result is not None
-            assert result.email == "test@example.com"
+        result = await get_current_user(db=mock_api_db_session, credentials=creds)
+        assert result is not None
+        assert result.email == "test@example.com"
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_raises_401_when_no_token_and_auth_required(self):
         """Missing token raises 401 when auth is required."""
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user(db=AsyncMock(), credentials=None)
-            assert exc_info.value.status_code == 401
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(db=AsyncMock(), credentials=None)
+        assert exc_info.value.status_code == 401
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_raises_401_for_expired_token(self):
         """Expired token raises 401."""
         payload = {
-            "sub": str(uuid.uuid4()),
+            "sub": str(fast_uuid()),
             "email": "test@example.com",
             "iat": datetime.now(UTC) - timedelta(hours=48),
             "exp": datetime.now(UTC) - timedelta(hours=24),
@@ -222,14 +286,14 @@ class TestGetCurrentUser:
         creds = MagicMock()
         creds.credentials = token
 
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user(db=AsyncMock(), credentials=creds)
-            assert exc_info.value.status_code == 401
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(db=AsyncMock(), credentials=creds)
+        assert exc_info.value.status_code == 401
 
-    async def test_raises_401_for_inactive_user(self, mock_api_db_session):
+    @pytest.mark.usefixtures("auth_enabled")
+    async def test_raises_401_for_inactive_user(self, mock_api_db_session, signed_token):
         """Inactive user raises 401 even with valid token."""
-        user_id = uuid.uuid4()
+        user_id, token = signed_token("inactive@example.com")
         user = User(
             id=user_id,
             email="inactive@example.com",
@@ -244,52 +308,50 @@ class TestGetCurrentUser:
         mock_result.scalar_one_or_none.return_value = user
         mock_api_db_session.execute = AsyncMock(return_value=mock_result)
 
-        token = create_access_token(user_id, "inactive@example.com")
         creds = MagicMock()
         creds.credentials = token
 
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await get_current_user(db=mock_api_db_session, credentials=creds)
-            assert exc_info.value.status_code == 401
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(db=mock_api_db_session, credentials=creds)
+        assert exc_info.value.status_code == 401
 
 
 class TestRequireAdmin:
     """Tests for the require_admin dependency."""
 
+    @pytest.mark.usefixtures("auth_disabled")
     async def test_returns_none_when_auth_disabled(self):
         """When auth is disabled, require_admin returns None."""
-        with patch.object(settings, "auth_required", False):
-            result = await require_admin(user=None)
-            assert result is None
+        result = await require_admin(user=None)
+        assert result is None
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_raises_401_when_no_user_and_auth_enabled(self):
         """When auth is enabled and no user, raises 401."""
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await require_admin(user=None)
-            assert exc_info.value.status_code == 401
+        with pytest.raises(HTTPException) as exc_info:
+            await require_admin(user=None)
+        assert exc_info.value.status_code == 401
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_raises_403_for_non_admin_user(self):
         """User without admin role gets 403."""
         user = MagicMock(spec=User)
         role = MagicMock()
         role.role = "viewer"
         user.project_roles = [role]
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await require_admin(user=user)
-            assert exc_info.value.status_code == 403
+        with pytest.raises(HTTPException) as exc_info:
+            await require_admin(user=user)
+        assert exc_info.value.status_code == 403
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_passes_for_admin_user(self):
         """User with admin role passes through."""
         user = MagicMock(spec=User)
         role = MagicMock()
         role.role = "admin"
         user.project_roles = [role]
-        with patch.object(settings, "auth_required", True):
-            result = await require_admin(user=user)
-            assert result is user
+        result = await require_admin(user=user)
+        assert result is user
 
 
 class TestAuthMeEndpoint:
@@ -299,11 +361,12 @@ class TestAuthMeEndpoint:
         """When auth_required=False, /auth/me returns 501 Not Implemented."""
         response = await client.get("/api/auth/me")
         assert response.status_code == 501
-        assert "not enabled" in response.json()["detail"].lower()
+        assert "not enabled" in rjson(response)["detail"].lower()
 
-    async def test_returns_user_when_authenticated(self, client, app, mock_api_db_session):
+    @pytest.mark.usefixtures("auth_enabled")
+    async def test_returns_user_when_authenticated(self, client, app, mock_api_db_session, signed_token):
         """With auth enabled and valid token, /auth/me returns user profile."""
-        user_id = uuid.uuid4()
+        user_id, token = signed_token("me@example.com")
         now = datetime.now(UTC)
         user = User(
             id=user_id,
@@ -319,22 +382,19 @@ class TestAuthMeEndpoint:
         mock_result.scalar_one_or_none.return_value = user
         mock_api_db_session.execute = AsyncMock(return_value=mock_result)
 
-        token = create_access_token(user_id, "me@example.com")
-
-        with patch.object(settings, "auth_required", True):
-            response = await client.get(
-                "/api/auth/me",
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            assert response.status_code == 200
-            data = response.json()
-            assert data["email"] == "me@example.com"
+        response = await client.get(
+            "/api/auth/me",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 200
+        data = rjson(response)
+        assert data["email"] == "me@example.com"
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_returns_401_without_token_when_auth_enabled(self, client):
         """With auth enabled and no token, /auth/me returns 401."""
-        with patch.object(settings, "auth_required", True):
-            response = await client.get("/api/auth/me")
-            assert response.status_code == 401
+        response = await client.get("/api/auth/me")
+        assert response.status_code == 401
 
 
 class TestAuthDisabledByDefault:
@@ -351,12 +411,9 @@ class TestAuthDisabledByDefault:
         assert response.status_code != 403
 
     async def test_documents_accessible_without_token(self, client, mock_api_db_session):
-        # First call: count query; second call: documents query
-        count_result = MagicMock()
-        count_result.scalar.return_value = 0
         doc_result = MagicMock()
         doc_result.all.return_value = []
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, doc_result])
+        mock_api_db_session.execute = AsyncMock(return_value=doc_result)
         response = await client.get("/api/documents")
         assert response.status_code != 401
         assert response.status_code != 403
@@ -391,54 +448,55 @@ class TestRequireRole:
         request.query_params = {}
         return request
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_sufficient_role_passes(self):
         """User with editor role passes a check requiring viewer."""
-        project_id = uuid.uuid4()
+        project_id = fast_uuid()
         user = self._make_user_with_role(project_id, "editor")
         request = self._make_request(str(project_id))
 
         checker = require_role("viewer")
-        with patch.object(settings, "auth_required", True):
-            result = await checker(request=request, user=user)
-            assert result is user
+        result = await checker(request=request, user=user)
+        assert result is user
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_exact_role_passes(self):
         """User with admin role passes a check requiring admin."""
-        project_id = uuid.uuid4()
+        project_id = fast_uuid()
         user = self._make_user_with_role(project_id, "admin")
         request = self._make_request(str(project_id))
 
         checker = require_role("admin")
-        with patch.object(settings, "auth_required", True):
-            result = await checker(request=request, user=user)
-            assert result is user
+        result = await checker(request=request, user=user)
+        assert result is user
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_insufficient_role_raises_403(self):
         """User with viewer role is rejected when admin is required."""
-        project_id = uuid.uuid4()
+        project_id = fast_uuid()
         user = self._make_user_with_role(project_id, "viewer")
         request = self._make_request(str(project_id))
 
         checker = require_role("admin")
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await checker(request=request, user=user)
-            assert exc_info.value.status_code == 403
-            assert "admin" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(request=request, user=user)
+        assert exc_info.value.status_code == 403
+        assert "admin" in exc_info.value.detail
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_role_on_different_project_raises_403(self):
         """User with admin role on project A is rejected for project B."""
-        project_a = uuid.uuid4()
-        project_b = uuid.uuid4()
+        project_a = fast_uuid()
+        project_b = fast_uuid()
         user = self._make_user_with_role(project_a, "admin")
         request = self._make_request(str(project_b))
 
         checker = require_role("viewer")
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await checker(request=request, user=user)
-            assert exc_info.value.status_code == 403
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(request=request, user=user)
+        assert exc_info.value.status_code == 403
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_missing_project_id_raises_400(self):
         """Missing project_id parameter raises 400."""
         user = MagicMock(spec=User)
@@ -446,79 +504,37 @@ class TestRequireRole:
         request = self._make_request(None)
 
         checker = require_role("viewer")
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await checker(request=request, user=user)
-            assert exc_info.value.status_code == 400
-            assert "project_id" in exc_info.value.detail
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(request=request, user=user)
+        assert exc_info.value.status_code == 400
+        assert "project_id" in exc_info.value.detail
 
+    @pytest.mark.usefixtures("auth_disabled")
     async def test_auth_disabled_returns_none(self):
         """When auth is disabled, require_role returns None."""
         request = self._make_request(None)
 
         checker = require_role("admin")
-        with patch.object(settings, "auth_required", False):
-            result = await checker(request=request, user=None)
-            assert result is None
+        result = await checker(request=request, user=None)
+        assert result is None
 
+    @pytest.mark.usefixtures("auth_enabled")
     async def test_no_user_raises_401(self):
         """When auth is enabled but user is None, raises 401."""
-        request = self._make_request(str(uuid.uuid4()))
+        request = self._make_request(str(fast_uuid()))
 
         checker = require_role("viewer")
-        with patch.object(settings, "auth_required", True):
-            with pytest.raises(HTTPException) as exc_info:
-                await checker(request=request, user=None)
-            assert exc_info.value.status_code == 401
+        with pytest.raises(HTTPException) as exc_info:
+            await checker(request=request, user=None)
+        assert exc_info.value.status_code == 401
 
 
 class TestGoogleOAuthLogin:
     """Tests for the POST /auth/google endpoint."""
 
-    def _mock_google_modules(self, fake_idinfo=None, side_effect=None):
-        """Helper: set up mock google.oauth2.id_token and google.auth.transport.requests modules.
-
-        Uses sys.modules patching because the google auth imports are lazy (inside the endpoint
-        function body), so we need the modules to exist when `from google.oauth2 import id_token`
-        is executed.
-        """
-        mock_id_token_module = MagicMock()
-        if side_effect:
-            mock_id_token_module.verify_oauth2_token.side_effect = side_effect
-        else:
-            mock_id_token_module.verify_oauth2_token.return_value = fake_idinfo
-
-        mock_requests_module = MagicMock()
-        mock_requests_module.Request.return_value = MagicMock()
-
-        # Build a coherent mock hierarchy so `from X import Y` works
-        mock_google = MagicMock()
-        mock_google_auth = MagicMock()
-        mock_google_auth_transport = MagicMock()
-        mock_google_oauth2 = MagicMock()
-
-        # Wire up attribute access
-        mock_google.auth = mock_google_auth
-        mock_google.oauth2 = mock_google_oauth2
-        mock_google_auth.transport = mock_google_auth_transport
-        mock_google_auth_transport.requests = mock_requests_module
-        mock_google_oauth2.id_token = mock_id_token_module
-
-        return patch.dict(
-            "sys.modules",
-            {
-                "google": mock_google,
-                "google.auth": mock_google_auth,
-                "google.auth.transport": mock_google_auth_transport,
-                "google.auth.transport.requests": mock_requests_module,
-                "google.oauth2": mock_google_oauth2,
-                "google.oauth2.id_token": mock_id_token_module,
-            },
-        )
-
     async def test_google_login_creates_new_user(self, client, mock_api_db_session):
         """Successful Google login creates a new user and returns JWT."""
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         now = datetime.now(UTC)
 
         # Mock: no existing user
@@ -544,21 +560,21 @@ class TestGoogleOAuthLogin:
             "sub": "google-sub-123",
         }
 
-        with self._mock_google_modules(fake_idinfo=fake_idinfo):
+        with _fake_google_auth(fake_idinfo=fake_idinfo):
             response = await client.post(
                 "/api/auth/google",
                 json={"id_token": "fake-google-id-token"},
             )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "access_token" in data
         assert data["token_type"] == "bearer"  # noqa: S105
         assert data["user"]["email"] == "new@example.com"
 
     async def test_google_login_existing_user(self, client, mock_api_db_session):
         """Google login with existing user updates profile and returns JWT."""
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         now = datetime.now(UTC)
         user = User(
             id=user_id,
@@ -580,31 +596,31 @@ class TestGoogleOAuthLogin:
             "sub": "google-sub-456",
         }
 
-        with self._mock_google_modules(fake_idinfo=fake_idinfo):
+        with _fake_google_auth(fake_idinfo=fake_idinfo):
             response = await client.post(
                 "/api/auth/google",
                 json={"id_token": "fake-google-id-token"},
             )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "access_token" in data
         assert data["user"]["email"] == "existing@example.com"
 
     async def test_google_login_invalid_token(self, client, mock_api_db_session):
         """Invalid Google ID token returns 401."""
-        with self._mock_google_modules(side_effect=ValueError("Invalid token")):
+        with _fake_google_auth(side_effect=ValueError("Invalid token")):
             response = await client.post(
                 "/api/auth/google",
                 json={"id_token": "bad-token"},
             )
 
         assert response.status_code == 401
-        assert "Invalid Google ID token" in response.json()["detail"]
+        assert "Invalid Google ID token" in rjson(response)["detail"]
 
     async def test_google_login_jwt_token_is_valid(self, client, mock_api_db_session):
         """The returned JWT can be decoded successfully."""
-        user_id = uuid.uuid4()
+        user_id = fast_uuid()
         now = datetime.now(UTC)
 
         mock_result = MagicMock()
@@ -624,56 +640,50 @@ class TestGoogleOAuthLogin:
 
         fake_idinfo = {"email": "jwt@example.com", "name": "JWT User", "sub": "g-sub"}
 
-        with self._mock_google_modules(fake_idinfo=fake_idinfo):
+        with _fake_google_auth(fake_idinfo=fake_idinfo):
             response = await client.post(
                 "/api/auth/google",
                 json={"id_token": "valid-google-token"},
             )
 
-        data = response.json()
+        data = rjson(response)
         payload = decode_access_token(data["access_token"])
         assert payload["sub"] == str(user_id)
         assert payload["email"] == "jwt@example.com"
 
 
+@pytest.mark.usefixtures("auth_enabled")
 class TestAuthEnforcedWhenEnabled:
     """When auth_required=True, endpoints must reject unauthenticated requests."""
 
     async def test_chat_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.post("/api/chat", json={"message": "hello"})
-            assert response.status_code == 401
+        response = await client.post("/api/chat", json={"message": "hello"})
+        assert response.status_code == 401
 
     async def test_chat_stream_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.post("/api/chat/stream", json={"message": "hello"})
-            assert response.status_code == 401
+        response = await client.post("/api/chat/stream", json={"message": "hello"})
+        assert response.status_code == 401
 
     async def test_search_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.post("/api/search", json={"query": "test"})
-            assert response.status_code == 401
+        response = await client.post("/api/search", json={"query": "test"})
+        assert response.status_code == 401
 
     async def test_documents_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.get("/api/documents")
-            assert response.status_code == 401
+        response = await client.get("/api/documents")
+        assert response.status_code == 401
 
     async def test_segments_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.get(f"/api/segments/{uuid.uuid4()}")
-            assert response.status_code == 401
+        response = await client.get(f"/api/segments/{fast_uuid()}")
+        assert response.status_code == 401
 
     async def test_stats_requires_auth(self, client):
-        with patch.object(settings, "auth_required", True):
-            response = await client.get("/api/stats")
-            assert response.status_code == 401
+        response = await client.get("/api/stats")
+        assert response.status_code == 401
 
     async def test_ingest_requires_admin_auth(self, client):
         """Non-admin users should be rejected from the ingest endpoint when auth is enabled."""
-        with patch.object(settings, "auth_required", True):
-            response = await client.post(
-                "/api/ingest/folder",
-                json={"path": "/tmp/docs"},
-            )
-            assert response.status_code == 401
+        response = await client.post(
+            "/api/ingest/folder",
+            json={"path": "/tmp/docs"},
+        )
+        assert response.status_code == 401
@@ -2,7 +2,10 @@
 
 from unittest.mock import AsyncMock, Mock
 
+import pytest
+
 from pam.agent.agent import AgentResponse
+from tests.test_api.helpers import rjson
 
 
 class TestChatEndpoint:
@@ -12,7 +15,7 @@ class TestChatEndpoint:
             json={"message": "What is revenue?"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["response"] == "Test answer"
         assert data["citations"] == []
         assert data["token_usage"]["total_tokens"] == 15
@@ -24,7 +27,7 @@ class TestChatEndpoint:
             json={"message": "Follow up", "conversation_id": "conv-123"},
         )
         assert response.status_code == 200
-        assert response.json()["conversation_id"] == "conv-123"
+        assert rjson(response)["conversation_id"] == "conv-123"
 
     async def test_chat_validation_error(self, client):
         response = await client.post("/api/chat", json={})
@@ -37,7 +40,7 @@ class TestChatEndpoint:
             json={"message": "test"},
         )
         assert response.status_code == 500
-        assert response.json()["detail"] == "An internal error occurred"
+        assert rjson(response)["detail"] == "An internal error occurred"
 
     async def test_chat_with_conversation_history(self, client, mock_agent):
         """Conversation history is forwarded to the agent as a kwarg."""
@@ -94,7 +97,7 @@ class TestChatEndpoint:
             json={"message": "Tell me about revenue"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["response"] == "Answer with citation"
         assert len(data["citations"]) == 1
 
@@ -112,13 +115,16 @@ class TestChatEndpoint:
 
         mock_agent.answer_streaming = fake_stream
 
-        response = await client.post(
-            "/api/chat/stream",
-            json={"message": "stream this"},
-        )
-        assert response.status_code == 200
-        assert response.headers["content-type"].startswith("text/event-stream")
-
-        # Verify the SSE payload contains our chunk
-        body = response.text
-        assert "streamed answer" in body
+        async with client.stream("POST", "/api/chat/stream", json={"message": "stream this"}) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+
+            # Verify the SSE payload contains our chunk, reading only until it shows up
+            # (accumulated, since a frame may be split across text chunks)
+            buf = ""
+            async for chunk in response.aiter_text():
+                buf += chunk
+                if "streamed answer" in buf:
+                    break
+            else:
+                pytest.fail("streamed chunk not found in SSE payload")
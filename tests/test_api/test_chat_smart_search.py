@@ -3,6 +3,7 @@
 from unittest.mock import AsyncMock
 
 from pam.agent.agent import AgentResponse, Citation
+from tests.test_api.helpers import rjson
 
 
 class TestChatSmartSearchIntegration:
@@ -31,7 +32,7 @@ class TestChatSmartSearchIntegration:
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert len(data["citations"]) == 1
         cit = data["citations"][0]
         assert cit["document_title"] == "Architecture Guide"
@@ -61,7 +62,7 @@ class TestChatSmartSearchIntegration:
         )
 
         assert response.status_code == 200
-        assert response.json()["response"] == "Found via entity search."
+        assert rjson(response)["response"] == "Found via entity search."
 
     async def test_chat_stream_with_smart_search_events(self, client, mock_agent):
         """Streaming endpoint returns SSE events including tool results."""
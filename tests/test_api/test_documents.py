@@ -2,89 +2,73 @@
 
 import uuid
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock
+
+from tests.test_api.helpers import rjson
+from tests.test_api.rows import DocRow, FakeResult, SegRow, TaskRow
+
+# Fixed IDs: the tests only compare them as strings, so they need not be random.
+_DOC_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_SEG_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+_TASK_ID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+_SEG_URL = f"/api/segments/{_SEG_ID}"
 
 
 class TestDocumentsEndpoint:
-    async def test_list_documents(self, client, mock_api_db_session):
+    async def test_list_documents(self, client, fake_db):
         now = datetime.now(UTC)
-        mock_doc = Mock()
-        mock_doc.id = uuid.uuid4()
-        mock_doc.source_type = "markdown"
-        mock_doc.source_id = "/test.md"
-        mock_doc.source_url = None
-        mock_doc.title = "Test Doc"
-        mock_doc.owner = None
-        mock_doc.status = "active"
-        mock_doc.content_hash = "abc"
-        mock_doc.last_synced_at = None
-        mock_doc.created_at = now
-
-        # First call: count query
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
-        # Second call: documents with segment counts
-        doc_result = Mock()
-        doc_result.all.return_value = [(mock_doc, 3)]
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, doc_result])
+        mock_doc = DocRow(id=_DOC_ID, title="Test Doc", created_at=now)
+
+        # One query: documents with segment counts and the total
+        fake_db.queue(FakeResult(rows=[(mock_doc, 3, 1)]))
 
         response = await client.get("/api/documents")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["total"] == 1
         assert len(data["items"]) == 1
         assert data["items"][0]["title"] == "Test Doc"
         assert data["items"][0]["segment_count"] == 3
         assert "cursor" in data
 
-    async def test_list_empty(self, client, mock_api_db_session):
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-
-        doc_result = Mock()
-        doc_result.all.return_value = []
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, doc_result])
+    async def test_list_empty(self, client, fake_db):
+        fake_db.queue(FakeResult())
 
         response = await client.get("/api/documents")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["items"] == []
         assert data["total"] == 0
 
 
 class TestSegmentEndpoint:
-    async def test_get_segment_success(self, client, mock_api_db_session):
+    async def test_get_segment_success(self, client, fake_db):
         """GET /api/segments/{id} returns segment with parent document info (single JOIN query)."""
-        seg_id = uuid.uuid4()
-        doc_id = uuid.uuid4()
-
-        mock_doc = Mock()
-        mock_doc.id = doc_id
-        mock_doc.title = "Annual Report 2024"
-        mock_doc.source_url = "http://example.com/report.pdf"
-        mock_doc.source_type = "pdf"
-
-        mock_segment = Mock()
-        mock_segment.id = seg_id
-        mock_segment.content = "Revenue was $10M in Q1."
-        mock_segment.segment_type = "text"
-        mock_segment.section_path = "Financials > Revenue"
-        mock_segment.position = 3
-        mock_segment.metadata_ = {"source": "annual_report"}
-        mock_segment.document_id = doc_id
-        mock_segment.document = mock_doc
+        seg_id = _SEG_ID
+        doc_id = _DOC_ID
+
+        mock_doc = DocRow(
+            id=doc_id,
+            title="Annual Report 2024",
+            source_type="pdf",
+            source_url="http://example.com/report.pdf",
+        )
+        mock_segment = SegRow(
+            id=seg_id,
+            document_id=doc_id,
+            content="Revenue was $10M in Q1.",
+            segment_type="text",
+            section_path="Financials > Revenue",
+            position=3,
+            metadata_={"source": "annual_report"},
+            document=mock_doc,
+        )
 
         # Single query with selectinload — only one execute call
-        seg_result = Mock()
-        seg_result.scalar_one_or_none.return_value = mock_segment
-        mock_api_db_session.execute = AsyncMock(return_value=seg_result)
+        fake_db.queue(FakeResult(scalar_value=mock_segment))
 
-        response = await client.get(f"/api/segments/{seg_id}")
+        response = await client.get(_SEG_URL)
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["id"] == str(seg_id)
         assert data["content"] == "Revenue was $10M in Q1."
         assert data["segment_type"] == "text"
@@ -95,59 +79,40 @@ class TestSegmentEndpoint:
         assert data["source_url"] == "http://example.com/report.pdf"
         assert data["source_type"] == "pdf"
 
-    async def test_get_segment_not_found(self, client, mock_api_db_session):
+    async def test_get_segment_not_found(self, client, fake_db):
         """GET /api/segments/{id} returns 404 when segment does not exist."""
-        seg_id = uuid.uuid4()
-
-        seg_result = Mock()
-        seg_result.scalar_one_or_none.return_value = None
-        mock_api_db_session.execute = AsyncMock(return_value=seg_result)
+        fake_db.queue(FakeResult())
 
-        response = await client.get(f"/api/segments/{seg_id}")
+        response = await client.get(_SEG_URL)
         assert response.status_code == 404
-        assert response.json()["detail"] == "Segment not found"
+        assert rjson(response)["detail"] == "Segment not found"
 
 
 class TestStatsEndpoint:
-    async def test_get_stats(self, client, mock_api_db_session):
+    async def test_get_stats(self, client, fake_db):
         """GET /api/stats returns aggregated statistics."""
-        task_id = uuid.uuid4()
-
-        # Mock for document counts by status
-        doc_count_result = Mock()
-        doc_count_result.all.return_value = [("active", 5), ("archived", 2)]
-
-        # Mock for total segment count
-        seg_count_result = Mock()
-        seg_count_result.scalar.return_value = 42
-
-        # Mock for entity counts by type
-        entity_count_result = Mock()
-        entity_count_result.all.return_value = [("person", 10), ("org", 8)]
-
-        # Mock for recent tasks
-        mock_task = Mock()
-        mock_task.id = task_id
-        mock_task.status = "completed"
-        mock_task.folder_path = "/data/reports"
-        mock_task.total_documents = 5
-        mock_task.succeeded = 4
-        mock_task.failed = 1
-        mock_task.created_at = None
-        mock_task.completed_at = None
-
-        task_result = Mock()
-        task_scalars = Mock()
-        task_scalars.all.return_value = [mock_task]
-        task_result.scalars.return_value = task_scalars
-
-        mock_api_db_session.execute = AsyncMock(
-            side_effect=[doc_count_result, seg_count_result, entity_count_result, task_result]
+        task_id = _TASK_ID
+
+        mock_task = TaskRow(
+            id=task_id,
+            status="completed",
+            folder_path="/data/reports",
+            total_documents=5,
+            succeeded=4,
+            failed=1,
+        )
+
+        # Document counts by status, segment total, entity counts by type, recent tasks
+        fake_db.queue(
+            FakeResult(rows=[("active", 5), ("archived", 2)]),
+            FakeResult(scalar_value=42),
+            FakeResult(rows=[("person", 10), ("org", 8)]),
+            FakeResult(rows=[(mock_task,)]),
         )
 
         response = await client.get("/api/stats")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
 
         assert data["documents"]["total"] == 7
         assert data["documents"]["by_status"]["active"] == 5
@@ -159,11 +124,3 @@ class TestStatsEndpoint:
         assert len(data["recent_tasks"]) == 1
         assert data["recent_tasks"][0]["status"] == "completed"
         assert data["recent_tasks"][0]["folder_path"] == "/data/reports"
-
-
-class TestDocumentsCursorValidation:
-    async def test_list_documents_invalid_cursor_returns_400(self, client):
-        """Invalid base64 cursor → 400 with 'Invalid cursor' (B904 exception chaining)."""
-        response = await client.get("/api/documents?cursor=not-valid-base64!!!")
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Invalid cursor"
@@ -1,7 +1,22 @@
 """Tests for graph endpoints — status, null guards, neighborhood, entities, history."""
 
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
+import pytest
+
+from tests.test_api.asgi import asgi_call
+from tests.test_api.graph_fakes import FakeDriver, FakeResult, graph_service
+from tests.test_api.helpers import rjson
+
+# Read-only Neo4j payloads shared across tests.
+_ENTITY_DATA = (
+    MappingProxyType({"labels": ("Entity", "Person"), "count": 5}),
+    MappingProxyType({"labels": ("Entity", "Technology"), "count": 3}),
+)
+_SYNC_RECORD = MappingProxyType({"last_sync": "2026-02-19T12:00:00Z"})
+
 
 def _mock_pg_counts(mock_db, doc_count=5, synced_count=3):
     """Configure db mock for the two PG count queries in graph_status.
@@ -24,42 +39,14 @@ class TestGraphStatusEndpoint:
         """Happy path: Neo4j returns entity counts and last sync time."""
         _mock_pg_counts(mock_api_db_session, doc_count=5, synced_count=3)
 
-        # Build a mock graph_service with a mock Neo4j driver session
-        mock_session = AsyncMock()
-
-        # Entity count query result
-        entity_data = [
-            {"labels": ["Entity", "Person"], "count": 5},
-            {"labels": ["Entity", "Technology"], "count": 3},
-        ]
-        # Last sync query result
-        sync_record = {"last_sync": "2026-02-19T12:00:00Z"}
-
-        mock_result_entities = AsyncMock()
-        mock_result_entities.data = AsyncMock(return_value=entity_data)
-
-        mock_result_sync = AsyncMock()
-        mock_result_sync.single = AsyncMock(return_value=sync_record)
-
-        mock_session.run = AsyncMock(side_effect=[mock_result_entities, mock_result_sync])
-
-        # Build the driver context manager chain
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        mock_graphiti_client = MagicMock()
-        mock_graphiti_client.driver = mock_driver
-
-        mock_graph_service = MagicMock()
-        mock_graph_service.client = mock_graphiti_client
-
-        app.state.graph_service = mock_graph_service
+        app.state.graph_service = graph_service(
+            FakeDriver([FakeResult(data=_ENTITY_DATA), FakeResult(single=_SYNC_RECORD)])
+        )
 
         response = await client.get("/api/graph/status")
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "connected"
         assert data["entity_counts"]["Person"] == 5
         assert data["entity_counts"]["Technology"] == 3
@@ -72,35 +59,14 @@ class TestGraphStatusEndpoint:
         """Connected but no episodic nodes -- last_sync_time is null."""
         _mock_pg_counts(mock_api_db_session, doc_count=0, synced_count=0)
 
-        mock_session = AsyncMock()
-
-        entity_data = []
-        sync_record = {"last_sync": None}
-
-        mock_result_entities = AsyncMock()
-        mock_result_entities.data = AsyncMock(return_value=entity_data)
-
-        mock_result_sync = AsyncMock()
-        mock_result_sync.single = AsyncMock(return_value=sync_record)
-
-        mock_session.run = AsyncMock(side_effect=[mock_result_entities, mock_result_sync])
-
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        mock_graphiti_client = MagicMock()
-        mock_graphiti_client.driver = mock_driver
-
-        mock_graph_service = MagicMock()
-        mock_graph_service.client = mock_graphiti_client
-
-        app.state.graph_service = mock_graph_service
+        app.state.graph_service = graph_service(
+            FakeDriver([FakeResult(data=[]), FakeResult(single={"last_sync": None})])
+        )
 
         response = await client.get("/api/graph/status")
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "connected"
         assert data["entity_counts"] == {}
         assert data["total_entities"] == 0
@@ -112,22 +78,12 @@ class TestGraphStatusEndpoint:
         """Neo4j session raises an exception -- returns disconnected status."""
         _mock_pg_counts(mock_api_db_session, doc_count=8, synced_count=3)
 
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__aenter__ = AsyncMock(side_effect=ConnectionError("Neo4j unreachable"))
-        mock_driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
-
-        mock_graphiti_client = MagicMock()
-        mock_graphiti_client.driver = mock_driver
-
-        mock_graph_service = MagicMock()
-        mock_graph_service.client = mock_graphiti_client
-
-        app.state.graph_service = mock_graph_service
+        app.state.graph_service = graph_service(FakeDriver(error=ConnectionError("Neo4j unreachable")))
 
         response = await client.get("/api/graph/status")
 
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "disconnected"
         assert "error" in data
         assert data["document_count"] == 8
@@ -144,7 +100,7 @@ class TestPhase11GraphNullGuards:
 
         response = await client.get("/api/graph/status")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "unavailable"
         assert data["document_count"] == 10
         assert data["graph_synced_count"] == 7
@@ -152,20 +108,17 @@ class TestPhase11GraphNullGuards:
         assert data["entity_counts"] == {}
         assert data["last_sync_time"] is None
 
-    async def test_neighborhood_503_when_graph_service_none(self, client):
-        """graph_service=None on neighborhood endpoint → 503 with structured error."""
-        response = await client.get("/api/graph/neighborhood/SomeEntity")
-        assert response.status_code == 503
-        assert response.json()["detail"] == "Graph service unavailable"
-
-    async def test_entities_503_when_graph_service_none(self, client):
-        """graph_service=None on entities endpoint → 503 with structured error."""
-        response = await client.get("/api/graph/entities")
-        assert response.status_code == 503
-        assert response.json()["detail"] == "Graph service unavailable"
-
-    async def test_entity_history_503_when_graph_service_none(self, client):
-        """graph_service=None on entity history endpoint → 503 with structured error."""
-        response = await client.get("/api/graph/entity/SomeEntity/history")
-        assert response.status_code == 503
-        assert response.json()["detail"] == "Graph service unavailable"
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/graph/neighborhood/SomeEntity",
+            "/api/graph/entities",
+            "/api/graph/entities?entity_type=Person&limit=5",
+            "/api/graph/entity/SomeEntity/history",
+        ],
+    )
+    async def test_data_endpoints_503_when_graph_service_none(self, app, url):
+        """graph_service=None on graph data endpoints → 503 with structured error."""
+        status, _, body = await asgi_call(app, "GET", url)
+        assert status == 503
+        assert orjson.loads(body)["detail"] == "Graph service unavailable"
@@ -1,145 +1,169 @@
 """Tests for GET /api/health endpoint."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from types import SimpleNamespace
 
+import pytest
 
-class TestHealthEndpoint:
-    async def test_health_all_services_up(self, app, client, mock_api_es_client, mock_api_db_session):
-        # Set redis_client on app.state for health check
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(return_value=True)
-        app.state.redis_client = mock_redis
-
-        # Set graph_service on app.state for Neo4j health check
-        mock_neo4j_session = AsyncMock()
-        mock_neo4j_session.run = AsyncMock()
-        mock_driver = MagicMock()
-        mock_driver.session.return_value.__aenter__ = AsyncMock(return_value=mock_neo4j_session)
-        mock_driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
-        mock_graphiti_client = MagicMock()
-        mock_graphiti_client.driver = mock_driver
-        mock_graph_service = MagicMock()
-        mock_graph_service.client = mock_graphiti_client
-        app.state.graph_service = mock_graph_service
-
-        mock_api_es_client.ping = AsyncMock(return_value=True)
-        mock_api_db_session.execute = AsyncMock()
+import pam.api.main as main_module
+from pam.common.config import get_settings
+from tests.test_api.graph_fakes import FakeDriver, FakeResult, graph_service
+from tests.test_api.helpers import rjson
 
-        response = await client.get("/api/health")
+_SERVICES = ("elasticsearch", "postgres", "redis", "neo4j")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["services"]["elasticsearch"] == "up"
-        assert data["services"]["postgres"] == "up"
-        assert data["services"]["redis"] == "up"
-        assert data["services"]["neo4j"] == "up"
 
-    async def test_health_es_down(self, app, client, mock_api_es_client, mock_api_db_session):
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(return_value=True)
-        app.state.redis_client = mock_redis
+def _async_returning(value):
+    """Plain coroutine function returning ``value``, or raising it if it is an exception.
 
-        mock_api_es_client.ping = AsyncMock(return_value=False)
-        mock_api_db_session.execute = AsyncMock()
+    Cheaper than ``AsyncMock`` for stubs whose calls are never inspected.
+    """
+    if isinstance(value, BaseException):
 
-        response = await client.get("/api/health")
+        async def _raise(*args, **kwargs):
+            raise value
 
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["services"]["elasticsearch"] == "down"
-        assert data["services"]["postgres"] == "up"
+        return _raise
 
-    async def test_health_es_exception(self, app, client, mock_api_es_client, mock_api_db_session):
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(return_value=True)
-        app.state.redis_client = mock_redis
+    async def _return(*args, **kwargs):
+        return value
 
-        mock_api_es_client.ping = AsyncMock(side_effect=ConnectionError("refused"))
-        mock_api_db_session.execute = AsyncMock()
+    return _return
 
-        response = await client.get("/api/health")
 
-        assert response.status_code == 503
-        data = response.json()
-        assert data["services"]["elasticsearch"] == "down"
-        assert data["services"]["postgres"] == "up"
+def _probe(state):
+    """Stub for a ping/execute probe: "up" succeeds, "down" returns False, "raises" errors."""
+    if state == "raises":
+        return _async_returning(ConnectionError("refused"))
+    return _async_returning(state == "up")
 
-    async def test_health_pg_down(self, app, client, mock_api_es_client, mock_api_db_session):
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(return_value=True)
-        app.state.redis_client = mock_redis
 
-        mock_api_es_client.ping = AsyncMock(return_value=True)
-        mock_api_db_session.execute = AsyncMock(side_effect=Exception("pg connection failed"))
+class TestHealthEndpoint:
+    @pytest.mark.parametrize(
+        ("es", "pg", "redis", "neo4j", "expected_code", "expected_services"),
+        [
+            pytest.param("up", "up", "up", True, 200, ("up", "up", "up", "up"), id="all_services_up"),
+            pytest.param("down", "up", "up", False, 503, ("down", "up", "up", "down"), id="es_down"),
+            pytest.param("raises", "up", "up", False, 503, ("down", "up", "up", "down"), id="es_exception"),
+            pytest.param("up", "raises", "up", False, 503, ("up", "down", "up", "down"), id="pg_down"),
+            pytest.param("down", "raises", None, False, 503, ("down", "down", "down", "down"), id="all_services_down"),
+            pytest.param("up", "up", "down", False, 200, ("up", "up", "down", "down"), id="redis_down"),
+            pytest.param(
+                "up", "up", None, False, 200, ("up", "up", "down", "down"), id="optional_services_unconfigured"
+            ),
+        ],
+    )
+    async def test_health(
+        self,
+        app,
+        client,
+        mock_api_es_client,
+        mock_api_db_session,
+        es,
+        pg,
+        redis,
+        neo4j,
+        expected_code,
+        expected_services,
+    ):
+        """ES and PG decide the status code; Redis and Neo4j are optional and only reported."""
+        mock_api_es_client.ping = _probe(es)
+        mock_api_db_session.execute = _probe(pg)
+        if redis is not None:
+            app.state.redis_client = SimpleNamespace(ping=_probe(redis))
+        if neo4j:
+            app.state.graph_service = graph_service(FakeDriver([FakeResult()]))
 
         response = await client.get("/api/health")
 
-        assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["services"]["elasticsearch"] == "up"
-        assert data["services"]["postgres"] == "down"
+        assert response.status_code == expected_code
+        data = rjson(response)
+        assert data["status"] == ("healthy" if expected_code == 200 else "unhealthy")
+        assert data["services"] == dict(zip(_SERVICES, expected_services, strict=True))
+        assert "services_latency_ms" not in data
+        assert response.headers["cache-control"].startswith("no-store")
+
+    async def test_hung_probe_times_out_as_down(self, client, mock_api_es_client, mock_api_db_session, monkeypatch):
+        """A probe that never answers is reported down after HEALTH_PROBE_TIMEOUT_S instead of stalling."""
+        monkeypatch.setattr(main_module, "HEALTH_PROBE_TIMEOUT_S", 0.01)
 
-    async def test_health_all_services_down(self, app, client, mock_api_es_client, mock_api_db_session):
-        # Redis not available
-        app.state.redis_client = None
-        # Neo4j not available
-        app.state.graph_service = None
+        async def _hang():
+            await asyncio.Event().wait()
 
-        mock_api_es_client.ping = AsyncMock(return_value=False)
-        mock_api_db_session.execute = AsyncMock(side_effect=Exception("pg down"))
+        mock_api_es_client.ping = _hang
+        mock_api_db_session.execute = _async_returning(True)
 
         response = await client.get("/api/health")
 
         assert response.status_code == 503
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["services"]["elasticsearch"] == "down"
-        assert data["services"]["postgres"] == "down"
-        assert data["services"]["redis"] == "down"
-        assert data["services"]["neo4j"] == "down"
-
-    async def test_health_redis_down(self, app, client, mock_api_es_client, mock_api_db_session):
-        # Redis client exists but ping fails
-        mock_redis = AsyncMock()
-        mock_redis.ping = AsyncMock(return_value=False)
-        app.state.redis_client = mock_redis
-
-        mock_api_es_client.ping = AsyncMock(return_value=True)
-        mock_api_db_session.execute = AsyncMock()
+        services = rjson(response)["services"]
+        assert services["elasticsearch"] == "down"
+        assert services["postgres"] == "up"
 
-        response = await client.get("/api/health")
+    async def test_cached_within_ttl(self, client, mock_api_es_client, mock_api_db_session, monkeypatch):
+        """With a TTL, back-to-back polls reuse one probe cycle."""
+        monkeypatch.setattr(get_settings(), "health_cache_ttl", 60.0)
+        calls = 0
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["services"]["elasticsearch"] == "up"
-        assert data["services"]["postgres"] == "up"
-        assert data["services"]["redis"] == "down"
+        async def _ping():
+            nonlocal calls
+            calls += 1
+            return True
 
-    async def test_health_returns_200_when_optional_services_down(
-        self,
-        app,
-        client,
-        mock_api_es_client,
-        mock_api_db_session,
+        mock_api_es_client.ping = _ping
+        mock_api_db_session.execute = _async_returning(True)
+
+        first = await client.get("/api/health")
+        second = await client.get("/api/health")
+
+        assert calls == 1
+        assert rjson(first) == rjson(second)
+
+    async def test_cached_verbose_polls_keep_latencies(
+        self, client, mock_api_es_client, mock_api_db_session, monkeypatch
     ):
-        """Health returns 200 if only optional services (Redis, Neo4j) are down."""
-        # Mock: PG and ES up, Redis and Neo4j down
-        app.state.redis_client = None
-        app.state.graph_service = None
+        """Verbose polls served from the cache still carry services_latency_ms."""
+        monkeypatch.setattr(get_settings(), "health_cache_ttl", 60.0)
+        calls = 0
+
+        async def _ping():
+            nonlocal calls
+            calls += 1
+            return True
+
+        mock_api_es_client.ping = _ping
+        mock_api_db_session.execute = _async_returning(True)
 
-        mock_api_es_client.ping = AsyncMock(return_value=True)
-        mock_api_db_session.execute = AsyncMock()
+        first = rjson(await client.get("/api/health", params={"verbose": 1}))
+        second = rjson(await client.get("/api/health", params={"verbose": 1}))
+
+        assert calls == 1
+        for data in (first, second):
+            assert set(data["services_latency_ms"]) == set(_SERVICES)
+        assert first == second
+
+    async def test_slow_es_ping_reports_down(self, client, mock_api_es_client, mock_api_db_session, monkeypatch):
+        """ES answering slower than health_es_slow_ms counts as down even though ping succeeded."""
+        monkeypatch.setattr(get_settings(), "health_es_slow_ms", 1.0)
+
+        async def _slow_ping():
+            await asyncio.sleep(0.01)
+            return True
+
+        mock_api_es_client.ping = _slow_ping
+        mock_api_db_session.execute = _async_returning(True)
 
         response = await client.get("/api/health")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["services"]["elasticsearch"] == "up"
-        assert data["services"]["postgres"] == "up"
-        assert data["services"]["redis"] == "down"
-        assert data["services"]["neo4j"] == "down"
+        assert response.status_code == 503
+        assert rjson(response)["services"]["elasticsearch"] == "down"
+
+    async def test_verbose_reports_per_service_latency(self, client, mock_api_es_client, mock_api_db_session):
+        """?verbose=1 adds services_latency_ms for every probed service."""
+        mock_api_es_client.ping = _async_returning(True)
+        mock_api_db_session.execute = _async_returning(True)
+
+        data = rjson(await client.get("/api/health", params={"verbose": 1}))
+
+        assert set(data["services_latency_ms"]) == set(_SERVICES)
+        assert all(ms >= 0 for ms in data["services_latency_ms"].values())
@@ -1,71 +1,97 @@
 """Tests for ingest endpoints — POST /api/ingest/folder, GET /api/ingest/tasks."""
 
-import uuid
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import pytest
+
 from pam.api.routes.ingest import _segment_to_knowledge_segment
+from pam.common.config import get_settings
 from pam.common.models import IngestionTask
+from tests.test_api.helpers import fast_uuid, rjson
+
+# Timestamps the tests never assert on; a constant avoids clock reads.
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def set_ingest_root(monkeypatch):
+    """Point ``settings.ingest_root`` at a path for one test."""
+
+    def _set(path):
+        monkeypatch.setattr(get_settings(), "ingest_root", str(path))
+
+    return _set
+
+
+@pytest.fixture(scope="module")
+def ingest_tmp_dir(tmp_path_factory):
+    """Folder holding one markdown file, shared by tests that only read it."""
+    folder = tmp_path_factory.mktemp("ingest")
+    (folder / "doc.md").write_text("# Test")
+    return folder
 
 
 class TestIngestEndpoint:
-    @patch("pam.api.routes.ingest.settings")
     @patch("pam.api.routes.ingest.spawn_ingestion_task")
     @patch("pam.api.routes.ingest.create_task")
-    async def test_ingest_returns_202(self, mock_create, mock_spawn, mock_settings, client, tmp_path):
-        (tmp_path / "doc.md").write_text("# Test")
-        mock_settings.ingest_root = str(tmp_path)
+    async def test_ingest_returns_202(self, mock_create, mock_spawn, client, set_ingest_root, ingest_tmp_dir):
+        set_ingest_root(ingest_tmp_dir)
 
-        task_id = uuid.uuid4()
+        task_id = fast_uuid()
         mock_task = MagicMock(spec=IngestionTask)
         mock_task.id = task_id
         mock_create.return_value = mock_task
 
         response = await client.post(
             "/api/ingest/folder",
-            json={"path": str(tmp_path)},
+            json={"path": str(ingest_tmp_dir)},
         )
         assert response.status_code == 202
-        data = response.json()
+        data = rjson(response)
         assert data["task_id"] == str(task_id)
         assert data["status"] == "pending"
         mock_spawn.assert_called_once()
 
-    @patch("pam.api.routes.ingest.settings")
-    async def test_ingest_invalid_path(self, mock_settings, client, tmp_path):
-        mock_settings.ingest_root = str(tmp_path)
-        nonexistent = str(tmp_path / "does_not_exist")
+    async def test_ingest_invalid_path(self, client, set_ingest_root, ingest_tmp_dir):
+        set_ingest_root(ingest_tmp_dir)
+        nonexistent = str(ingest_tmp_dir / "does_not_exist")
         response = await client.post(
             "/api/ingest/folder",
             json={"path": nonexistent},
         )
         assert response.status_code == 400
 
-    @patch("pam.api.routes.ingest.settings")
-    async def test_ingest_root_not_configured(self, mock_settings, client, tmp_path):
-        mock_settings.ingest_root = ""
+    async def test_ingest_rejects_unknown_fields(self, client, set_ingest_root, ingest_tmp_dir):
+        set_ingest_root(ingest_tmp_dir)
         response = await client.post(
             "/api/ingest/folder",
-            json={"path": str(tmp_path)},
+            json={"path": str(ingest_tmp_dir), "recursive": True},
+        )
+        assert response.status_code == 422
+
+    async def test_ingest_root_not_configured(self, client, set_ingest_root, ingest_tmp_dir):
+        set_ingest_root("")
+        response = await client.post(
+            "/api/ingest/folder",
+            json={"path": str(ingest_tmp_dir)},
         )
         assert response.status_code == 400
-        assert "not configured" in response.json()["detail"]
+        assert "not configured" in rjson(response)["detail"]
 
-    @patch("pam.api.routes.ingest.settings")
-    async def test_ingest_path_outside_root(self, mock_settings, client, tmp_path):
-        mock_settings.ingest_root = str(tmp_path / "allowed")
+    async def test_ingest_path_outside_root(self, client, set_ingest_root, ingest_tmp_dir):
+        set_ingest_root(ingest_tmp_dir / "allowed")
         response = await client.post(
             "/api/ingest/folder",
             json={"path": "/etc"},
         )
         assert response.status_code == 403
-        assert "outside" in response.json()["detail"]
+        assert "outside" in rjson(response)["detail"]
 
-    @patch("pam.api.routes.ingest.settings")
-    async def test_ingest_path_traversal_rejected(self, mock_settings, client, tmp_path):
+    async def test_ingest_path_traversal_rejected(self, client, set_ingest_root, tmp_path):
         allowed = tmp_path / "allowed"
         allowed.mkdir()
-        mock_settings.ingest_root = str(allowed)
+        set_ingest_root(allowed)
         response = await client.post(
             "/api/ingest/folder",
             json={"path": str(allowed / ".." / "other")},
@@ -74,28 +100,28 @@ class TestIngestEndpoint:
 
     @patch("pam.api.routes.ingest.get_task")
     async def test_get_task_found(self, mock_get_task, client):
-        from datetime import datetime
-
-        task_id = uuid.uuid4()
-        mock_task = MagicMock(spec=IngestionTask)
-        mock_task.id = task_id
-        mock_task.status = "running"
-        mock_task.folder_path = "/tmp/docs"
-        mock_task.total_documents = 5
-        mock_task.processed_documents = 2
-        mock_task.succeeded = 2
-        mock_task.skipped = 0
-        mock_task.failed = 0
-        mock_task.results = []
-        mock_task.error = None
-        mock_task.created_at = datetime.now(UTC)
-        mock_task.started_at = datetime.now(UTC)
-        mock_task.completed_at = None
+        task_id = fast_uuid()
+        mock_task = MagicMock(
+            spec=IngestionTask,
+            id=task_id,
+            status="running",
+            folder_path="/tmp/docs",
+            total_documents=5,
+            processed_documents=2,
+            succeeded=2,
+            skipped=0,
+            failed=0,
+            results=[],
+            error=None,
+            created_at=_NOW,
+            started_at=_NOW,
+            completed_at=None,
+        )
         mock_get_task.return_value = mock_task
 
         response = await client.get(f"/api/ingest/tasks/{task_id}")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "running"
         assert data["total_documents"] == 5
         assert data["processed_documents"] == 2
@@ -103,35 +129,22 @@ class TestIngestEndpoint:
     @patch("pam.api.routes.ingest.get_task")
     async def test_get_task_not_found(self, mock_get_task, client):
         mock_get_task.return_value = None
-        response = await client.get(f"/api/ingest/tasks/{uuid.uuid4()}")
+        response = await client.get(f"/api/ingest/tasks/{fast_uuid()}")
         assert response.status_code == 404
 
     async def test_list_tasks(self, client, mock_api_db_session):
-        # First call: count query
-        count_result = MagicMock()
-        count_result.scalar.return_value = 0
-
-        # Second call: tasks query
         task_result = MagicMock()
-        task_scalars = MagicMock()
-        task_scalars.all.return_value = []
-        task_result.scalars.return_value = task_scalars
+        task_result.all.return_value = []
 
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, task_result])
+        mock_api_db_session.execute = AsyncMock(return_value=task_result)
 
         response = await client.get("/api/ingest/tasks")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["items"] == []
         assert data["total"] == 0
         assert data["cursor"] == ""
 
-    async def test_list_tasks_invalid_cursor_returns_400(self, client):
-        """Invalid base64 cursor → 400 with 'Invalid cursor' (B904 exception chaining)."""
-        response = await client.get("/api/ingest/tasks?cursor=not-valid-base64!!!")
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Invalid cursor"
-
 
 class TestSegmentToKnowledgeSegment:
     """Phase 10: Test the pure _segment_to_knowledge_segment converter."""
@@ -139,7 +152,7 @@ class TestSegmentToKnowledgeSegment:
     def test_converts_orm_segment_fields(self):
         """Maps ORM Segment fields to KnowledgeSegment correctly."""
         seg = Mock()
-        seg.id = uuid.uuid4()
+        seg.id = fast_uuid()
         seg.content = "Some content"
         seg.content_hash = "abc123"
         seg.segment_type = "text"
@@ -160,7 +173,7 @@ class TestSegmentToKnowledgeSegment:
     def test_handles_none_metadata(self):
         """When metadata_ is None, defaults to empty dict."""
         seg = Mock()
-        seg.id = uuid.uuid4()
+        seg.id = fast_uuid()
         seg.content = "text"
         seg.content_hash = "h"
         seg.segment_type = "text"
@@ -184,7 +197,7 @@ class TestSyncGraphEndpoint:
         """doc.modified_at is used as primary reference_time in sync-graph."""
         ts = datetime(2024, 5, 20, 14, 0, 0, tzinfo=UTC)
         mock_doc = Mock()
-        mock_doc.id = uuid.uuid4()
+        mock_doc.id = fast_uuid()
         mock_doc.title = "Test"
         mock_doc.source_id = "/test.md"
         mock_doc.modified_at = ts
@@ -222,4 +235,4 @@ class TestSyncGraphEndpoint:
 
         response = await client.post("/api/ingest/sync-graph")
         assert response.status_code == 503
-        assert "not available" in response.json()["detail"]
+        assert "not available" in rjson(response)["detail"]
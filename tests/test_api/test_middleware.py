@@ -1,9 +1,16 @@
 """Tests for API middleware -- CorrelationId and RequestLogging (pure ASGI)."""
 
 import re
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+import pam.api.middleware as middleware_module
 from pam.api.middleware import CorrelationIdMiddleware, RequestLoggingMiddleware
+from tests.test_api.helpers import rjson
+
+_CID_RE = re.compile(r"[0-9a-f]{16}")
+_ALLOWED_HEALTH_KEYS = frozenset({"status", "services", "auth_required", "checks", "version", "uptime", "timestamp"})
 
 
 class TestCorrelationIdMiddleware:
@@ -23,8 +30,8 @@ class TestCorrelationIdMiddleware:
         """Auto-generated correlation ID is a 16-char hex string."""
         response = await client.get("/api/health")
         cid = response.headers["x-correlation-id"]
-        # set_correlation_id generates uuid4().hex[:16] -- 16 hex chars
-        assert re.fullmatch(r"[0-9a-f]{16}", cid), f"Unexpected correlation ID format: {cid}"
+        # set_correlation_id formats 64 bits as 16 lowercase hex chars
+        assert _CID_RE.fullmatch(cid), f"Unexpected correlation ID format: {cid}"
 
 
 class TestCorrelationIdMiddlewareASGI:
@@ -42,6 +49,24 @@ class TestCorrelationIdMiddlewareASGI:
         await middleware({"type": "websocket"}, AsyncMock(), AsyncMock())
         assert inner_called
 
+    @pytest.mark.parametrize("headers", [[(b"content-type", b"text/plain")], ((b"content-type", b"text/plain"),), None])
+    async def test_appends_raw_header(self, headers):
+        """The correlation ID header is appended whatever shape the start message's headers take."""
+        start = {"type": "http.response.start", "status": 200}
+        if headers is not None:
+            start["headers"] = headers
+        sent = []
+
+        async def inner_app(scope, receive, send):
+            await send(start)
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = CorrelationIdMiddleware(inner_app)
+        await middleware({"type": "http", "headers": [(b"x-correlation-id", b"abc")]}, AsyncMock(), send)
+        assert list(sent[0]["headers"])[-1] == (b"x-correlation-id", b"abc")
+
     async def test_asgi_call_interface(self):
         """Middleware uses __call__(scope, receive, send) -- pure ASGI."""
         assert callable(CorrelationIdMiddleware)
@@ -57,15 +82,13 @@ class TestRequestLoggingMiddleware:
     async def test_logging_middleware_does_not_modify_response(self, client):
         """Response body from the endpoint is returned unchanged by the middleware."""
         response = await client.get("/api/health")
-        data = response.json()
+        data = rjson(response)
         # The health endpoint returns a JSON object with a "status" key at minimum
         assert "status" in data
         # Verify the middleware did not inject extra top-level keys.
         # The health endpoint returns status + service/auth info.
-        allowed_keys = {"status", "services", "auth_required", "checks", "version", "uptime", "timestamp"}
-        assert set(data.keys()).issubset(allowed_keys), (
-            f"Unexpected keys in response: {set(data.keys()) - allowed_keys}"
-        )
+        keys = data.keys()
+        assert keys <= _ALLOWED_HEALTH_KEYS, f"Unexpected keys in response: {keys - _ALLOWED_HEALTH_KEYS}"
 
 
 class TestRequestLoggingMiddlewareASGI:
@@ -105,6 +128,19 @@ class TestRequestLoggingMiddlewareASGI:
         assert sent_messages[0]["type"] == "http.response.start"
         assert sent_messages[0]["status"] == 201
 
+    @pytest.mark.parametrize(("path", "logged"), [("/api/health", False), ("/api/documents", True)])
+    async def test_skips_health_path(self, monkeypatch, path, logged):
+        """The polled health check is passed through without an http_request log line."""
+        logger = MagicMock()
+        monkeypatch.setattr(middleware_module, "logger", logger)
+
+        async def inner_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        middleware = RequestLoggingMiddleware(inner_app)
+        await middleware({"type": "http", "method": "GET", "path": path, "headers": []}, AsyncMock(), AsyncMock())
+        assert logger.info.called is logged
+
     async def test_asgi_call_interface(self):
         """Middleware uses __call__(scope, receive, send) -- pure ASGI."""
         assert callable(RequestLoggingMiddleware)
@@ -1,18 +1,24 @@
 """Tests for cursor-based pagination utilities and endpoint pagination behavior."""
 
-import uuid
+import base64
+import re
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from pam.api.pagination import DEFAULT_PAGE_SIZE, PaginatedResponse, decode_cursor, encode_cursor
+from tests.test_api.helpers import fast_uuid, rjson
+from tests.test_api.rows import DocRow, FakeResult
+
+_B64URL_RE = re.compile(r"[A-Za-z0-9_=-]+")
+# Fixed timestamp: the endpoint tests only need ordering, and stable values keep cursors reproducible.
+_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
 
 
 class TestCursorEncoding:
     def test_encode_decode_roundtrip(self):
         """Encoding and decoding a cursor should return the original values."""
-        item_id = str(uuid.uuid4())
+        item_id = str(fast_uuid())
         sort_value = datetime.now(UTC).isoformat()
 
         cursor = encode_cursor(item_id, sort_value)
@@ -27,9 +33,38 @@ class TestCursorEncoding:
         assert isinstance(cursor, str)
         assert len(cursor) > 0
         # URL-safe base64 characters only
-        import re
+        assert _B64URL_RE.fullmatch(cursor)
+
+    def test_uuid_and_aware_timestamp_pack_compactly(self):
+        """(UUID, tz-aware ISO timestamp) cursors use the fixed binary layout."""
+        item_id = "00000000-0000-0000-0000-00000000002a"
+        sort_value = "2024-05-20T14:00:00.123456+00:00"
 
-        assert re.match(r"^[A-Za-z0-9_=-]+$", cursor)
+        cursor = encode_cursor(item_id, sort_value)
+
+        assert len(cursor) == 34  # 25 bytes, unpadded base64
+        assert decode_cursor(cursor) == {"id": item_id, "sv": sort_value}
+
+    @pytest.mark.parametrize(
+        ("item_id", "sort_value"),
+        [
+            ("entity-uuid", "entity-uuid"),
+            ("00000000-0000-0000-0000-00000000002a", ""),
+            ("00000000-0000-0000-0000-00000000002a", "2024-05-20T14:00:00"),
+            ("00000000-0000-0000-0000-00000000002a", "2024-05-20T16:00:00+02:00"),
+        ],
+    )
+    def test_other_values_roundtrip_via_json(self, item_id, sort_value):
+        assert decode_cursor(encode_cursor(item_id, sort_value)) == {"id": item_id, "sv": sort_value}
+
+    def test_decodes_padded_json_cursor(self):
+        """Cursors issued before the binary layout still decode."""
+        legacy = base64.urlsafe_b64encode(b'{"id": "abc", "sv": "2024-01-01T00:00:00"}').decode()
+        assert decode_cursor(legacy) == {"id": "abc", "sv": "2024-01-01T00:00:00"}
+
+    def test_decode_out_of_range_timestamp_raises_value_error(self):
+        with pytest.raises(ValueError, match="out of range"):
+            decode_cursor("AQAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAQA")
 
     def test_decode_invalid_cursor_raises(self):
         """Decoding an invalid cursor should raise an error."""
@@ -55,169 +90,114 @@ class TestPaginatedResponse:
 class TestDocumentPagination:
     """Test pagination behavior on the /documents endpoint."""
 
-    async def test_returns_paginated_envelope(self, client, mock_api_db_session):
+    async def test_returns_paginated_envelope(self, client, fake_db):
         """GET /documents should return {items, total, cursor} envelope."""
-        now = datetime.now(UTC)
-        mock_doc = Mock()
-        mock_doc.id = uuid.uuid4()
-        mock_doc.source_type = "markdown"
-        mock_doc.source_id = "/test.md"
-        mock_doc.source_url = None
-        mock_doc.title = "Test Doc"
-        mock_doc.owner = None
-        mock_doc.status = "active"
-        mock_doc.content_hash = "abc"
-        mock_doc.last_synced_at = None
-        mock_doc.created_at = now
-        mock_doc.updated_at = now
-
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
-        doc_result = Mock()
-        doc_result.all.return_value = [(mock_doc, 3)]
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, doc_result])
+        doc = DocRow(id=fast_uuid(), title="Test Doc", created_at=_NOW, updated_at=_NOW)
+        fake_db.queue(FakeResult(rows=[(doc, 3, 1)]))
 
         response = await client.get("/api/documents?limit=10")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "items" in data
         assert "total" in data
         assert "cursor" in data
         assert data["total"] == 1
         assert len(data["items"]) == 1
+        assert len(fake_db.statements) == 1
 
-    async def test_empty_cursor_on_last_page(self, client, mock_api_db_session):
+    async def test_empty_cursor_on_last_page(self, client, fake_db):
         """When there are no more pages, cursor should be empty string."""
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-
-        doc_result = Mock()
-        doc_result.all.return_value = []
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, doc_result])
+        fake_db.queue(FakeResult())
 
         response = await client.get("/api/documents")
-        data = response.json()
+        data = rjson(response)
         assert data["cursor"] == ""
 
-    async def test_invalid_cursor_returns_400(self, client, mock_api_db_session):
-        """Invalid cursor parameter should return 400."""
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-        mock_api_db_session.execute = AsyncMock(return_value=count_result)
-
-        response = await client.get("/api/documents?cursor=invalid!!!")
-        assert response.status_code == 400
-        assert "cursor" in response.json()["detail"].lower()
-
-    async def test_cursor_pagination_traversal(self, client, mock_api_db_session):
+    async def test_cursor_pagination_traversal(self, client, fake_db):
         """Two pages of results should not overlap when following cursor."""
-        now = datetime.now(UTC)
-
-        # Page 1: 2 docs + 1 extra (has_next=True)
-        doc1 = Mock()
-        doc1.id = uuid.uuid4()
-        doc1.source_type = "markdown"
-        doc1.source_id = "/a.md"
-        doc1.source_url = None
-        doc1.title = "Doc A"
-        doc1.owner = None
-        doc1.status = "active"
-        doc1.content_hash = "a"
-        doc1.last_synced_at = None
-        doc1.created_at = now
-        doc1.updated_at = now
-
-        doc2 = Mock()
-        doc2.id = uuid.uuid4()
-        doc2.source_type = "markdown"
-        doc2.source_id = "/b.md"
-        doc2.source_url = None
-        doc2.title = "Doc B"
-        doc2.owner = None
-        doc2.status = "active"
-        doc2.content_hash = "b"
-        doc2.last_synced_at = None
-        doc2.created_at = now - timedelta(seconds=1)
-        doc2.updated_at = now - timedelta(seconds=1)
-
-        doc3 = Mock()
-        doc3.id = uuid.uuid4()
-        doc3.source_type = "markdown"
-        doc3.source_id = "/c.md"
-        doc3.source_url = None
-        doc3.title = "Doc C"
-        doc3.owner = None
-        doc3.status = "active"
-        doc3.content_hash = "c"
-        doc3.last_synced_at = None
-        doc3.created_at = now - timedelta(seconds=2)
-        doc3.updated_at = now - timedelta(seconds=2)
-
-        # First request: count + docs (limit=2, returns 3 rows to detect next page)
-        count1 = Mock()
-        count1.scalar.return_value = 3
-        page1_result = Mock()
-        page1_result.all.return_value = [(doc1, 1), (doc2, 2), (doc3, 0)]
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count1, page1_result])
+        doc1, doc2, doc3 = (
+            DocRow(
+                id=fast_uuid(),
+                title=f"Doc {name}",
+                source_id=f"/{name.lower()}.md",
+                content_hash=name.lower(),
+                created_at=_NOW - timedelta(seconds=age),
+                updated_at=_NOW - timedelta(seconds=age),
+            )
+            for age, name in enumerate("ABC")
+        )
+
+        # First request: docs with the total (limit=2, returns 3 rows to detect next page)
+        fake_db.queue(FakeResult(rows=[(doc1, 1, 3), (doc2, 2, 3), (doc3, 0, 3)]))
 
         resp1 = await client.get("/api/documents?limit=2")
         assert resp1.status_code == 200
-        data1 = resp1.json()
+        data1 = rjson(resp1)
         assert len(data1["items"]) == 2
         assert data1["cursor"] != ""  # has more pages
         page1_ids = {item["id"] for item in data1["items"]}
 
         # Second request: use cursor from page 1
-        count2 = Mock()
-        count2.scalar.return_value = 3
-        page2_result = Mock()
-        page2_result.all.return_value = [(doc3, 0)]
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count2, page2_result])
+        fake_db.queue(FakeResult(rows=[(doc3, 0, 3)]))
 
         resp2 = await client.get(f"/api/documents?limit=2&cursor={data1['cursor']}")
         assert resp2.status_code == 200
-        data2 = resp2.json()
+        data2 = rjson(resp2)
         assert len(data2["items"]) == 1
         assert data2["cursor"] == ""  # last page
+        assert data2["total"] == 3  # the cursor filter does not narrow the total
+        assert len(fake_db.statements) == 2  # one query per page
         page2_ids = {item["id"] for item in data2["items"]}
 
         # No overlap between pages
         assert page1_ids.isdisjoint(page2_ids)
 
+    async def test_empty_page_after_cursor_counts_separately(self, client, fake_db):
+        """A cursor page with no rows carries no total column, so the total is counted on its own."""
+        fake_db.queue(FakeResult(), FakeResult(scalar_value=7))
+
+        cursor = encode_cursor(str(fast_uuid()), _NOW.isoformat())
+        response = await client.get(f"/api/documents?cursor={cursor}")
+        assert response.status_code == 200
+        assert rjson(response)["total"] == 7
+
+
+@pytest.mark.parametrize("path", ["/api/documents", "/api/admin/users", "/api/ingest/tasks"])
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        pytest.param("not-valid-base64!!!", id="bad-base64"),
+        # Binary layout with micros=2**62: past datetime.max, so decoding overflows
+        pytest.param("AQAAAAAAAAAAAAAAAAAAAAEAAAAAAAAAQA", id="timestamp-overflow"),
+    ],
+)
+async def test_invalid_cursor_returns_400(client, fake_db, path, cursor):
+    """Malformed cursor → 400 with 'Invalid cursor' (B904 exception chaining), before any query."""
+    response = await client.get(f"{path}?cursor={cursor}")
+    assert response.status_code == 400
+    assert rjson(response)["detail"] == "Invalid cursor"
+    assert fake_db.statements == []
+
 
 class TestAdminUserPagination:
     """Test pagination on /admin/users endpoint."""
 
-    async def test_returns_paginated_envelope(self, client, mock_api_db_session):
+    async def test_returns_paginated_envelope(self, client, fake_db):
         from pam.common.models import User
 
         user = User(
-            id=uuid.uuid4(),
+            id=fast_uuid(),
             email="user@test.com",
             name="Test",
             is_active=True,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
-
-        count_result = Mock()
-        count_result.scalar.return_value = 1
-
-        user_result = Mock()
-        user_scalars = Mock()
-        user_scalars.all.return_value = [user]
-        user_result.scalars.return_value = user_scalars
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, user_result])
+        fake_db.queue(FakeResult(rows=[(user, 1)]))
 
         response = await client.get("/api/admin/users?limit=10")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "items" in data
         assert "total" in data
         assert "cursor" in data
@@ -227,20 +207,12 @@ class TestAdminUserPagination:
 class TestIngestTaskPagination:
     """Test pagination on /ingest/tasks endpoint."""
 
-    async def test_returns_paginated_envelope(self, client, mock_api_db_session):
-        count_result = Mock()
-        count_result.scalar.return_value = 0
-
-        task_result = Mock()
-        task_scalars = Mock()
-        task_scalars.all.return_value = []
-        task_result.scalars.return_value = task_scalars
-
-        mock_api_db_session.execute = AsyncMock(side_effect=[count_result, task_result])
+    async def test_returns_paginated_envelope(self, client, fake_db):
+        fake_db.queue(FakeResult())
 
         response = await client.get("/api/ingest/tasks")
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["items"] == []
         assert data["total"] == 0
         assert data["cursor"] == ""
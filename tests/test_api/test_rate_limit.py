@@ -1,12 +1,14 @@
 """Tests for rate limiting middleware."""
 
 import pytest
+import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 import pam.api.rate_limit as rate_limit_module
 from pam.api.main import create_app
+from tests.test_api.helpers import rjson
 
 
 @pytest.fixture
@@ -23,7 +25,7 @@ def app_with_low_limit(monkeypatch):
     return app
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def client(app_with_low_limit):
     transport = ASGITransport(app=app_with_low_limit, raise_app_exceptions=False)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
@@ -41,4 +43,4 @@ async def test_rate_limit_returns_429_when_exceeded(client):
     # Third request should be rate limited
     resp = await client.get("/api/health")
     assert resp.status_code == 429
-    assert "Rate limit" in resp.json()["detail"]
+    assert "Rate limit" in rjson(resp)["detail"]
@@ -3,16 +3,21 @@
 import uuid
 from unittest.mock import AsyncMock
 
+import pytest
+
 from pam.retrieval.types import SearchResult
+from tests.test_api.helpers import rjson
+
+# Fixed ID: the tests never inspect it, so it need not be random.
+_SEGMENT_ID = uuid.UUID(int=1)
 
 
 class TestSearchEndpoint:
     async def test_search_success(self, client, mock_search_service, mock_api_embedder):
-        sid = uuid.uuid4()
         mock_search_service.search_from_query = AsyncMock(
             return_value=[
                 SearchResult(
-                    segment_id=sid,
+                    segment_id=_SEGMENT_ID,
                     content="Revenue was $10M",
                     score=0.95,
                     document_title="Report",
@@ -24,12 +29,21 @@ class TestSearchEndpoint:
             json={"query": "revenue"},
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert len(data) == 1
         assert data[0]["content"] == "Revenue was $10M"
 
-    async def test_search_validation_error(self, client):
-        response = await client.post("/api/search", json={})
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {},
+            {"query": "revenue", "top_k": 0},  # ge=1
+            {"query": "revenue", "top_k": 51},  # le=50
+        ],
+    )
+    async def test_search_bad_input(self, client, payload):
+        """A missing query or top_k outside [1, 50] returns 422."""
+        response = await client.post("/api/search", json=payload)
         assert response.status_code == 422
 
     async def test_search_empty_results(self, client, mock_search_service):
@@ -39,7 +53,7 @@ class TestSearchEndpoint:
             json={"query": "nonexistent"},
         )
         assert response.status_code == 200
-        assert response.json() == []
+        assert rjson(response) == []
 
     async def test_search_with_filters(self, client, mock_search_service, mock_api_embedder):
         """Filter parameters are forwarded to the search service via SearchQuery."""
@@ -78,19 +92,3 @@ class TestSearchEndpoint:
         call_args = mock_search_service.search_from_query.call_args
         query_arg = call_args[0][0]
         assert query_arg.top_k == 25
-
-    async def test_search_top_k_validation(self, client):
-        """top_k outside the allowed range [1, 50] returns 422."""
-        # top_k = 0 should fail (ge=1)
-        response = await client.post(
-            "/api/search",
-            json={"query": "revenue", "top_k": 0},
-        )
-        assert response.status_code == 422
-
-        # top_k = 51 should fail (le=50)
-        response = await client.post(
-            "/api/search",
-            json={"query": "revenue", "top_k": 51},
-        )
-        assert response.status_code == 422
@@ -6,10 +6,21 @@ from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
+import redis.asyncio as redis
 
 from pam.common.cache import CacheService, _make_search_key
 
 
+@pytest.fixture
+def mock_redis():
+    client = AsyncMock(spec=redis.Redis)
+    # redis-py's command methods are plain defs returning awaitables, so the spec alone yields sync children.
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock()
+    client.delete = AsyncMock(return_value=1)
+    return client
+
+
 class TestMakeSearchKey:
     def test_deterministic(self):
         key1 = _make_search_key("hello", 10, None, None)
@@ -101,15 +112,6 @@ class TestCacheServiceTTLInjection:
 
 
 class TestCacheServiceSearchResults:
-    @pytest.fixture
-    def mock_redis(self):
-        client = AsyncMock()
-        client.get = AsyncMock(return_value=None)
-        client.set = AsyncMock()
-        client.delete = AsyncMock(return_value=1)
-        client.scan_iter = AsyncMock()
-        return client
-
     @pytest.fixture
     def cache(self, mock_redis):
         return CacheService(mock_redis, search_ttl=900, session_ttl=86400)
@@ -120,7 +122,7 @@ class TestCacheServiceSearchResults:
 
     async def test_get_cache_hit(self, cache, mock_redis):
         stored = [{"segment_id": str(uuid.uuid4()), "content": "test", "score": 0.9}]
-        mock_redis.get = AsyncMock(return_value=json.dumps(stored))
+        mock_redis.get.return_value = json.dumps(stored)
 
         result = await cache.get_search_results("test query", 10)
         assert result is not None
@@ -162,7 +164,7 @@ class TestCacheServiceSearchResults:
             for key in ["search:abc", "search:def"]:
                 yield key
 
-        mock_redis.scan_iter = fake_scan_iter
+        mock_redis.scan_iter.side_effect = fake_scan_iter
         await cache.invalidate_search()
         mock_redis.delete.assert_called_once_with("search:abc", "search:def")
 
@@ -171,21 +173,13 @@ class TestCacheServiceSearchResults:
             return
             yield  # make it an async generator
 
-        mock_redis.scan_iter = fake_scan_iter
+        mock_redis.scan_iter.side_effect = fake_scan_iter
         deleted = await cache.invalidate_search()
         assert deleted == 0
         mock_redis.delete.assert_not_called()
 
 
 class TestCacheServiceSessions:
-    @pytest.fixture
-    def mock_redis(self):
-        client = AsyncMock()
-        client.get = AsyncMock(return_value=None)
-        client.set = AsyncMock()
-        client.delete = AsyncMock()
-        return client
-
     @pytest.fixture
     def cache(self, mock_redis):
         return CacheService(mock_redis, search_ttl=900, session_ttl=86400)
@@ -196,7 +190,7 @@ class TestCacheServiceSessions:
 
     async def test_get_session_hit(self, cache, mock_redis):
         messages = [{"role": "user", "content": "hello"}]
-        mock_redis.get = AsyncMock(return_value=json.dumps(messages))
+        mock_redis.get.return_value = json.dumps(messages)
 
         result = await cache.get_session("sess-123")
         assert result is not None
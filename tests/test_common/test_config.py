@@ -135,22 +135,24 @@ def test_conversation_settings_defaults():
 
 
 class TestGetSettings:
+    @pytest.fixture(autouse=True)
+    def _clear_settings_cache(self):
+        """Start each test from an empty ``get_settings`` cache."""
+        reset_settings()
+
     def test_get_settings_returns_settings_instance(self):
         """get_settings() should return a Settings instance."""
-        reset_settings()
         s = get_settings()
         assert isinstance(s, Settings)
 
     def test_get_settings_is_cached(self):
         """Repeated calls to get_settings() should return the same object."""
-        reset_settings()
         s1 = get_settings()
         s2 = get_settings()
         assert s1 is s2
 
     def test_reset_settings_clears_cache(self):
         """reset_settings() should cause a new Settings instance to be created."""
-        reset_settings()
         s1 = get_settings()
         reset_settings()
         s2 = get_settings()
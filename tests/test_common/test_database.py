@@ -5,24 +5,49 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import pam.common.database as database_module
+from pam.common.config import settings
 from pam.common.database import get_db, get_engine, get_session_factory, reset_database
 
 
+@pytest.fixture(autouse=True)
+def create_engine_stub(monkeypatch):
+    """Stand in for ``create_async_engine`` so no real engine, dialect or pool is built.
+
+    The engine caches are cleared on both sides so no stub outlives the test.
+    """
+    stub = MagicMock()
+    monkeypatch.setattr(database_module, "create_async_engine", stub)
+    reset_database()
+    yield stub
+    reset_database()
+
+
 class TestEngineConfiguration:
-    def test_pool_size(self):
+    def test_database_url(self, create_engine_stub):
+        """Engine should connect to the configured database URL."""
+        get_engine()
+        assert create_engine_stub.call_args.args == (settings.database_url,)
+
+    def test_pool_size(self, create_engine_stub):
         """Engine should be created with pool_size=5."""
-        engine = get_engine()
-        assert engine.pool.size() == 5
+        get_engine()
+        assert create_engine_stub.call_args.kwargs["pool_size"] == 5
 
-    def test_max_overflow(self):
+    def test_max_overflow(self, create_engine_stub):
         """Engine should be created with max_overflow=10."""
-        engine = get_engine()
-        assert engine.pool._max_overflow == 10
+        get_engine()
+        assert create_engine_stub.call_args.kwargs["max_overflow"] == 10
 
-    def test_echo_disabled(self):
+    def test_echo_disabled(self, create_engine_stub):
         """Engine should have echo=False for production use."""
-        engine = get_engine()
-        assert engine.echo is False
+        get_engine()
+        assert create_engine_stub.call_args.kwargs["echo"] is False
+
+    def test_engine_is_cached(self, create_engine_stub):
+        """Repeated calls reuse the first engine."""
+        assert get_engine() is get_engine()
+        create_engine_stub.assert_called_once()
 
 
 class TestSessionFactory:
@@ -30,6 +55,7 @@ class TestSessionFactory:
         """Factory should produce AsyncSession instances."""
         factory = get_session_factory()
         assert factory.class_ is AsyncSession
+        assert factory.kw["bind"] is get_engine()
 
     def test_expire_on_commit_is_false(self):
         """Factory should disable expire_on_commit to allow post-commit attribute access."""
@@ -2,30 +2,45 @@
 
 from __future__ import annotations
 
+import dataclasses
 import uuid
 
 import pytest
 from haystack import Document
 
-from pam.common.haystack_adapter import haystack_doc_to_search_result, segment_to_haystack_doc
+from pam.common.haystack_adapter import (
+    haystack_doc_to_search_result,
+    haystack_docs_to_search_results,
+    segment_to_haystack_doc,
+)
 from pam.common.models import KnowledgeSegment
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Fixtures (module-scoped: the segments are only read, never mutated)
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def segment_id() -> uuid.UUID:
     return uuid.UUID("aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def document_id() -> uuid.UUID:
     return uuid.UUID("11111111-2222-3333-4444-555555555555")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def segment_id_str(segment_id: uuid.UUID) -> str:
+    return str(segment_id)
+
+
+@pytest.fixture(scope="module")
+def document_id_str(document_id: uuid.UUID) -> str:
+    return str(document_id)
+
+
+@pytest.fixture(scope="module")
 def full_segment(segment_id: uuid.UUID, document_id: uuid.UUID) -> KnowledgeSegment:
     """A KnowledgeSegment with all fields populated."""
     return KnowledgeSegment(
@@ -45,7 +60,7 @@ def full_segment(segment_id: uuid.UUID, document_id: uuid.UUID) -> KnowledgeSegm
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def minimal_segment(segment_id: uuid.UUID) -> KnowledgeSegment:
     """A KnowledgeSegment with only required fields."""
     return KnowledgeSegment(
@@ -57,23 +72,29 @@ def minimal_segment(segment_id: uuid.UUID) -> KnowledgeSegment:
     )
 
 
+@pytest.fixture(scope="module")
+def base_doc(segment_id_str: str) -> Document:
+    """Minimal Document carrying only its segment ID; tests derive variants with ``dataclasses.replace``."""
+    return Document(id=segment_id_str, content="Content", meta={"segment_id": segment_id_str})
+
+
 # ---------------------------------------------------------------------------
 # segment_to_haystack_doc
 # ---------------------------------------------------------------------------
 
 
 class TestSegmentToHaystackDoc:
-    def test_maps_all_fields(self, full_segment: KnowledgeSegment, segment_id: uuid.UUID, document_id: uuid.UUID):
+    def test_maps_all_fields(self, full_segment: KnowledgeSegment, segment_id_str: str, document_id_str: str):
         doc = segment_to_haystack_doc(full_segment)
 
         assert isinstance(doc, Document)
-        assert doc.id == str(segment_id)
+        assert doc.id == segment_id_str
         assert doc.content == "Revenue grew 15% year-over-year."
         assert doc.embedding == [0.1, 0.2, 0.3]
 
         meta = doc.meta
-        assert meta["segment_id"] == str(segment_id)
-        assert meta["document_id"] == str(document_id)
+        assert meta["segment_id"] == segment_id_str
+        assert meta["document_id"] == document_id_str
         assert meta["source_type"] == "markdown"
         assert meta["source_id"] == "/docs/report.md"
         assert meta["source_url"] == "file:///docs/report.md"
@@ -107,13 +128,13 @@ class TestSegmentToHaystackDoc:
 
 
 class TestHaystackDocToSearchResult:
-    def test_maps_all_fields_from_meta(self, segment_id: uuid.UUID):
+    def test_maps_all_fields_from_meta(self, segment_id: uuid.UUID, segment_id_str: str):
         doc = Document(
-            id=str(segment_id),
+            id=segment_id_str,
             content="Test content",
             score=0.85,
             meta={
-                "segment_id": str(segment_id),
+                "segment_id": segment_id_str,
                 "source_url": "file:///test.md",
                 "source_id": "/test.md",
                 "section_path": "Intro",
@@ -133,39 +154,21 @@ class TestHaystackDocToSearchResult:
         assert result.document_title == "Test Doc"
         assert result.segment_type == "table"
 
-    def test_explicit_score_overrides_doc_score(self, segment_id: uuid.UUID):
-        doc = Document(
-            id=str(segment_id),
-            content="Content",
-            score=0.5,
-            meta={"segment_id": str(segment_id)},
-        )
-
-        result = haystack_doc_to_search_result(doc, score=0.99)
-        assert result.score == 0.99
-
-    def test_falls_back_to_doc_score(self, segment_id: uuid.UUID):
-        doc = Document(
-            id=str(segment_id),
-            content="Content",
-            score=0.72,
-            meta={"segment_id": str(segment_id)},
-        )
-
-        result = haystack_doc_to_search_result(doc, score=None)
-        assert result.score == 0.72
-
-    def test_falls_back_to_zero_when_no_scores(self, segment_id: uuid.UUID):
-        doc = Document(
-            id=str(segment_id),
-            content="Content",
-            meta={"segment_id": str(segment_id)},
-        )
-        # Haystack Document.score defaults to None
-        assert doc.score is None
+    @pytest.mark.parametrize(
+        ("doc_score", "arg_score", "expected"),
+        [
+            pytest.param(0.5, 0.99, 0.99, id="explicit-overrides-doc"),
+            pytest.param(0.72, None, 0.72, id="falls-back-to-doc"),
+            pytest.param(None, None, 0.0, id="falls-back-to-zero"),  # Document.score defaults to None
+        ],
+    )
+    def test_score_resolution(
+        self, base_doc: Document, doc_score: float | None, arg_score: float | None, expected: float
+    ):
+        doc = dataclasses.replace(base_doc, score=doc_score)
 
-        result = haystack_doc_to_search_result(doc)
-        assert result.score == 0.0
+        result = haystack_doc_to_search_result(doc, score=arg_score)
+        assert result.score == expected
 
     def test_uses_doc_id_when_segment_id_missing_from_meta(self):
         doc_id = str(uuid.uuid4())
@@ -187,13 +190,8 @@ class TestHaystackDocToSearchResult:
         assert result.document_title is None
         assert result.segment_type == "text"
 
-    def test_missing_optional_meta_fields(self, segment_id: uuid.UUID):
-        doc = Document(
-            id=str(segment_id),
-            content="Content",
-            score=0.5,
-            meta={"segment_id": str(segment_id)},
-        )
+    def test_missing_optional_meta_fields(self, base_doc: Document):
+        doc = dataclasses.replace(base_doc, score=0.5)
 
         result = haystack_doc_to_search_result(doc)
         assert result.source_url is None
@@ -202,47 +200,75 @@ class TestHaystackDocToSearchResult:
         assert result.document_title is None
         assert result.segment_type == "text"
 
-    def test_empty_content_becomes_empty_string(self, segment_id: uuid.UUID):
-        doc = Document(
-            id=str(segment_id),
-            content=None,
-            meta={"segment_id": str(segment_id)},
-        )
+    def test_repeated_conversions_keep_segment_id(self, base_doc: Document, segment_id: uuid.UUID):
+        """Converting the same document again (a repeat retrieval) yields the same segment ID."""
+        first = haystack_doc_to_search_result(base_doc)
+        second = haystack_doc_to_search_result(base_doc)
+        assert first.segment_id == second.segment_id == segment_id
+
+    def test_empty_content_becomes_empty_string(self, base_doc: Document):
+        doc = dataclasses.replace(base_doc, content=None)
 
         result = haystack_doc_to_search_result(doc)
         assert result.content == ""
 
 
+# ---------------------------------------------------------------------------
+# haystack_docs_to_search_results
+# ---------------------------------------------------------------------------
+
+
+class TestHaystackDocsToSearchResults:
+    @pytest.mark.parametrize("n", [0, 1, 100, 1000])
+    def test_batch_conversion_shape(self, n: int):
+        """Each document converts in order, keeping its own segment ID and score."""
+        ids = [uuid.UUID(int=i) for i in range(n)]
+        docs = [Document(id=str(i), content="x", score=0.5, meta={"segment_id": str(i)}) for i in ids]
+
+        results = haystack_docs_to_search_results(docs)
+
+        assert [r.segment_id for r in results] == ids
+        assert all(r.content == "x" and r.score == 0.5 for r in results)
+
+    def test_matches_single_document_conversion(self, full_segment: KnowledgeSegment, base_doc: Document):
+        """Batch conversion applies the same fallbacks as the per-document converter."""
+        no_meta = Document(id=str(uuid.UUID(int=7)), content=None)
+        no_meta.meta = None  # type: ignore[assignment]
+        docs = [
+            dataclasses.replace(segment_to_haystack_doc(full_segment), score=0.9),
+            base_doc,
+            Document(id=str(uuid.UUID(int=8)), content="Content", meta={"segment_type": "table"}),
+            no_meta,
+        ]
+
+        assert haystack_docs_to_search_results(docs) == [haystack_doc_to_search_result(doc) for doc in docs]
+
+
 # ---------------------------------------------------------------------------
 # Round-trip
 # ---------------------------------------------------------------------------
 
 
 class TestRoundTrip:
-    def test_segment_to_doc_to_result_preserves_data(self, full_segment: KnowledgeSegment, segment_id: uuid.UUID):
+    @pytest.mark.parametrize(
+        ("segment_fixture", "score"),
+        [pytest.param("full_segment", 0.92, id="full"), pytest.param("minimal_segment", 0.5, id="minimal")],
+    )
+    def test_segment_to_doc_to_result_preserves_data(
+        self, request: pytest.FixtureRequest, segment_fixture: str, score: float, segment_id: uuid.UUID
+    ):
         """segment -> haystack doc -> search result should preserve key fields."""
-        doc = segment_to_haystack_doc(full_segment)
-        doc.score = 0.92  # Simulate a score assigned by retrieval
-
-        result = haystack_doc_to_search_result(doc)
-
-        assert result.segment_id == segment_id
-        assert result.content == full_segment.content
-        assert result.score == 0.92
-        assert result.source_url == full_segment.source_url
-        assert result.source_id == full_segment.source_id
-        assert result.section_path == full_segment.section_path
-        assert result.document_title == full_segment.document_title
-        assert result.segment_type == full_segment.segment_type
-
-    def test_round_trip_with_minimal_segment(self, minimal_segment: KnowledgeSegment, segment_id: uuid.UUID):
-        doc = segment_to_haystack_doc(minimal_segment)
-        doc.score = 0.5
+        segment: KnowledgeSegment = request.getfixturevalue(segment_fixture)
+        doc = segment_to_haystack_doc(segment)
+        doc.score = score  # Simulate a score assigned by retrieval
 
         result = haystack_doc_to_search_result(doc)
 
         assert result.segment_id == segment_id
-        assert result.content == minimal_segment.content
-        assert result.score == 0.5
-        assert result.source_url is None
-        assert result.segment_type == "text"
+        assert result.content == segment.content
+        assert result.score == score
+        assert result.source_url == segment.source_url
+        assert result.source_id == segment.source_id
+        assert result.section_path == segment.section_path
+        assert result.document_title == segment.document_title
+        assert result.segment_type == segment.segment_type
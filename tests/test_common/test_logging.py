@@ -1,5 +1,9 @@
 """Tests for pam.common.logging — correlation IDs and CostTracker."""
 
+import time
+
+import pytest
+
 from pam.common.logging import (
     CostTracker,
     correlation_id_var,
@@ -19,6 +23,15 @@ class TestCorrelationId:
         assert len(cid) == 16
         assert get_correlation_id() == cid
 
+    def test_auto_generated_ids_do_not_repeat(self):
+        ids = {set_correlation_id() for _ in range(100_000)}
+        assert len(ids) == 100_000
+
+    def test_auto_generated_ids_sort_by_creation_time(self):
+        first = set_correlation_id()
+        time.sleep(0.002)
+        assert set_correlation_id() > first
+
     def test_default_empty(self):
         # Reset to default
         token = correlation_id_var.set("")
@@ -28,15 +41,18 @@ class TestCorrelationId:
             correlation_id_var.reset(token)
 
 
+@pytest.fixture
+def tracker():
+    return CostTracker()
+
+
 class TestCostTracker:
-    def test_empty_tracker(self):
-        tracker = CostTracker()
+    def test_empty_tracker(self, tracker):
         assert tracker.total_cost == 0.0
         assert tracker.total_tokens == 0
         assert tracker.calls == []
 
-    def test_log_llm_call(self):
-        tracker = CostTracker()
+    def test_log_llm_call(self, tracker):
         tracker.log_llm_call(
             model="claude-sonnet-4-5-20250514",
             input_tokens=1000,
@@ -51,8 +67,7 @@ class TestCostTracker:
         assert tracker.total_tokens == 1500
         assert tracker.total_cost > 0
 
-    def test_log_embedding_call(self):
-        tracker = CostTracker()
+    def test_log_embedding_call(self, tracker):
         tracker.log_embedding_call(
             model="text-embedding-3-large",
             input_tokens=500,
@@ -63,8 +78,7 @@ class TestCostTracker:
         assert tracker.total_tokens == 500
         assert tracker.total_cost > 0
 
-    def test_multiple_calls_accumulate(self):
-        tracker = CostTracker()
+    def test_multiple_calls_accumulate(self, tracker):
         tracker.log_llm_call("claude-sonnet-4-5-20250514", 100, 50, 100.0)
         tracker.log_llm_call("claude-sonnet-4-5-20250514", 200, 100, 150.0)
         assert len(tracker.calls) == 2
@@ -13,6 +13,9 @@ from pam.common.models import (
     RawDocument,
 )
 
+# Fixed timestamp: these tests check schema structure, not recency.
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class TestKnowledgeSegment:
     def test_create_with_defaults(self):
@@ -57,7 +60,6 @@ class TestKnowledgeSegment:
 
 class TestDocumentResponse:
     def test_valid_response(self):
-        now = datetime.now(UTC)
         resp = DocumentResponse(
             id=uuid.uuid4(),
             source_type="markdown",
@@ -67,15 +69,14 @@ class TestDocumentResponse:
             owner=None,
             status="active",
             content_hash="abc",
-            last_synced_at=now,
-            created_at=now,
+            last_synced_at=_NOW,
+            created_at=_NOW,
             segment_count=5,
         )
         assert resp.segment_count == 5
         assert resp.status == "active"
 
     def test_default_segment_count(self):
-        now = datetime.now(UTC)
         resp = DocumentResponse(
             id=uuid.uuid4(),
             source_type="markdown",
@@ -86,7 +87,7 @@ class TestDocumentResponse:
             status="active",
             content_hash=None,
             last_synced_at=None,
-            created_at=now,
+            created_at=_NOW,
         )
         assert resp.segment_count == 0
 
@@ -99,13 +100,12 @@ class TestDocumentInfo:
         assert info.modified_at is None
 
     def test_full(self):
-        now = datetime.now(UTC)
         info = DocumentInfo(
             source_id="abc",
             title="My Doc",
             owner="user@example.com",
             source_url="https://example.com",
-            modified_at=now,
+            modified_at=_NOW,
         )
         assert info.owner == "user@example.com"
 
@@ -1,26 +1,22 @@
 """Tests for pam.common.utils."""
 
-from pam.common.utils import escape_like
-
-
-class TestEscapeLike:
-    def test_no_wildcards(self):
-        assert escape_like("hello world") == "hello world"
-
-    def test_escapes_percent(self):
-        assert escape_like("100%") == "100\\%"
+import pytest
 
-    def test_escapes_underscore(self):
-        assert escape_like("file_name") == "file\\_name"
-
-    def test_escapes_backslash(self):
-        assert escape_like("path\\to") == "path\\\\to"
-
-    def test_escapes_all_wildcards(self):
-        assert escape_like("%_\\") == "\\%\\_\\\\"
+from pam.common.utils import escape_like
 
-    def test_empty_string(self):
-        assert escape_like("") == ""
 
-    def test_multiple_wildcards(self):
-        assert escape_like("a%b%c_d") == "a\\%b\\%c\\_d"
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("hello world", "hello world"),
+        ("100%", "100\\%"),
+        ("file_name", "file\\_name"),
+        ("path\\to", "path\\\\to"),
+        ("%_\\", "\\%\\_\\\\"),
+        ("", ""),
+        ("a%b%c_d", "a\\%b\\%c\\_d"),
+    ],
+    ids=["no_wildcards", "percent", "underscore", "backslash", "all_wildcards", "empty", "multiple_wildcards"],
+)
+def test_escape_like(raw, expected):
+    assert escape_like(raw) == expected
@@ -2,7 +2,8 @@
 
 import json
 import uuid
-from unittest.mock import AsyncMock, Mock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 from pydantic import ValidationError
@@ -101,10 +102,19 @@ class TestExtractionSchemas:
 
 class TestEntityExtractor:
     @pytest.fixture
-    def mock_anthropic(self):
-        return AsyncMock()
+    def make_extractor(self):
+        """Build an EntityExtractor whose Anthropic client replies to every call with ``text``."""
 
-    async def test_extract_metric(self, mock_anthropic):
+        def _make(text: str) -> EntityExtractor:
+            client = AsyncMock()
+            client.messages.create = AsyncMock(return_value=SimpleNamespace(content=[SimpleNamespace(text=text)]))
+            extractor = EntityExtractor()
+            extractor.client = client
+            return extractor
+
+        return _make
+
+    async def test_extract_metric(self, make_extractor):
         # Mock Claude response with a metric extraction
         response_data = json.dumps(
             [
@@ -115,16 +125,7 @@ class TestEntityExtractor:
                 }
             ]
         )
-        text_block = Mock()
-        text_block.text = response_data
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+        extractor = make_extractor(response_data)
 
         results = await extractor.extract_from_text("DAU is the count of distinct users per day.")
         assert len(results) == 1
@@ -132,7 +133,7 @@ class TestEntityExtractor:
         assert results[0].entity_data["name"] == "DAU"
         assert results[0].confidence == 0.9
 
-    async def test_extract_multiple_types(self, mock_anthropic):
+    async def test_extract_multiple_types(self, make_extractor):
         response_data = json.dumps(
             [
                 {
@@ -147,16 +148,7 @@ class TestEntityExtractor:
                 },
             ]
         )
-        text_block = Mock()
-        text_block.text = response_data
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+        extractor = make_extractor(response_data)
 
         results = await extractor.extract_from_text("Conversion rate is signups/visits. Target: 3.5% for Q1.")
         assert len(results) == 2
@@ -169,38 +161,20 @@ class TestEntityExtractor:
         results = await extractor.extract_from_text("")
         assert results == []
 
-    async def test_extract_invalid_json(self, mock_anthropic):
-        text_block = Mock()
-        text_block.text = "This is not valid JSON"
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+    async def test_extract_invalid_json(self, make_extractor):
+        extractor = make_extractor("This is not valid JSON")
 
         results = await extractor.extract_from_text("Some text")
         assert results == []
 
-    async def test_extract_unknown_entity_type(self, mock_anthropic):
+    async def test_extract_unknown_entity_type(self, make_extractor):
         response_data = json.dumps([{"entity_type": "unknown_type", "entity_data": {"foo": "bar"}, "confidence": 0.5}])
-        text_block = Mock()
-        text_block.text = response_data
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+        extractor = make_extractor(response_data)
 
         results = await extractor.extract_from_text("Some text")
         assert results == []  # Unknown types are skipped
 
-    async def test_extract_with_segment_id(self, mock_anthropic):
+    async def test_extract_with_segment_id(self, make_extractor):
         seg_id = uuid.uuid4()
         response_data = json.dumps(
             [
@@ -211,35 +185,17 @@ class TestEntityExtractor:
                 }
             ]
         )
-        text_block = Mock()
-        text_block.text = response_data
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+        extractor = make_extractor(response_data)
 
         results = await extractor.extract_from_text("DAU target: 50000", segment_id=seg_id)
         assert len(results) == 1
         assert results[0].source_segment_id == seg_id
 
-    async def test_batch_extraction(self, mock_anthropic):
+    async def test_batch_extraction(self, make_extractor):
         response_data = json.dumps(
             [{"entity_type": "metric_definition", "entity_data": {"name": "DAU"}, "confidence": 0.9}]
         )
-        text_block = Mock()
-        text_block.text = response_data
-        response = Mock()
-        response.content = [text_block]
-
-        mock_anthropic.messages = AsyncMock()
-        mock_anthropic.messages.create = AsyncMock(return_value=response)
-
-        extractor = EntityExtractor()
-        extractor.client = mock_anthropic
+        extractor = make_extractor(response_data)
 
         segments = [
             {"id": uuid.uuid4(), "content": "DAU is daily active users."},
@@ -1,6 +1,7 @@
 """Tests for OpenAIEmbedder — embedding with batching, caching, cost tracking."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from pam.common.logging import CostTracker
 from pam.ingestion.embedders.openai_embedder import BATCH_SIZE, OpenAIEmbedder
@@ -8,17 +9,10 @@ from pam.ingestion.embedders.openai_embedder import BATCH_SIZE, OpenAIEmbedder
 
 def _make_embed_response(count: int, dims: int = 1536):
     """Create a mock embeddings response with `count` items."""
-    data = []
-    for i in range(count):
-        item = Mock()
-        item.embedding = [float(i) / 10] * dims
-        data.append(item)
-    usage = Mock()
-    usage.total_tokens = count * 10
-    response = Mock()
-    response.data = data
-    response.usage = usage
-    return response
+    return SimpleNamespace(
+        data=[SimpleNamespace(embedding=[float(i) / 10] * dims) for i in range(count)],
+        usage=SimpleNamespace(total_tokens=count * 10),
+    )
 
 
 class TestOpenAIEmbedder: